@@ -3,9 +3,13 @@ Action types that agents can return.
 
 Actions represent what the agent wants to do in response to an event.
 The platform executes these actions and converts them to Events.
+
+Actions are immutable, so frequently repeated ones can be shared
+between turns via the ``of()`` constructors instead of reallocated.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING
 
 from ..core.events import MessageSubtype, Expression, Preference
@@ -14,13 +18,13 @@ if TYPE_CHECKING:
     from ..domain.models import Offer
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Action:
     """Base class for all agent actions."""
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SendMessage(Action):
     """
     Send a chat message.
@@ -37,7 +41,7 @@ class SendMessage(Action):
     delay_ms: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SendOffer(Action):
     """
     Send an offer proposal.
@@ -50,7 +54,7 @@ class SendOffer(Action):
     delay_ms: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SendExpression(Action):
     """
     Display an emotional expression.
@@ -63,9 +67,15 @@ class SendExpression(Action):
     expression: Expression
     duration_ms: int = 2000
     delay_ms: int = 0
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def of(cls, expression: Expression, duration_ms: int = 2000, delay_ms: int = 0) -> "SendExpression":
+        """Get a shared instance for these arguments."""
+        return cls(expression, duration_ms=duration_ms, delay_ms=delay_ms)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Schedule(Action):
     """
     Schedule an action for later execution.
@@ -81,7 +91,7 @@ class Schedule(Action):
     action: Action
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FormalAccept(Action):
     """
     Formally accept the current offer.
@@ -89,9 +99,15 @@ class FormalAccept(Action):
     Only valid if offer is complete (no items in middle).
     """
     delay_ms: int = 0
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def of(cls, delay_ms: int = 0) -> "FormalAccept":
+        """Get a shared instance for this delay."""
+        return cls(delay_ms=delay_ms)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FormalReject(Action):
     """
     Formally reject and end negotiation.
@@ -102,7 +118,7 @@ class FormalReject(Action):
     delay_ms: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShowTyping(Action):
     """
     Show "typing..." indicator.
@@ -132,15 +148,8 @@ def chain_actions(*actions: Action, base_delay_ms: int = 0, gap_ms: int = 500) -
     Returns:
         List of Schedule-wrapped actions
     """
-    result = []
-    current_delay = base_delay_ms
-    
-    for action in actions:
-        if current_delay > 0:
-            result.append(Schedule(delay_ms=current_delay, action=action))
-        else:
-            result.append(action)
-        current_delay += gap_ms
-    
-    return result
+    return [
+        Schedule(delay_ms=delay, action=action) if (delay := base_delay_ms + i * gap_ms) > 0 else action
+        for i, action in enumerate(actions)
+    ]
 
@@ -6,11 +6,15 @@ Follows IAGO's event-driven pattern where agents react to events.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
 
-from .actions import Action
+from .actions import Action, SendMessage, SendExpression, FormalAccept
 from .context import AgentContext
-from ..core.events import Event, EventType
+from ..core.events import Event, EventType, Expression, MessageSubtype
+
+
+# Shared result for events that produce no actions (never mutate)
+_NO_ACTIONS: tuple[Action, ...] = ()
 
 
 class NegotiationAgent(ABC):
@@ -32,6 +36,19 @@ class NegotiationAgent(ABC):
     def __init__(self, agent_id: str = "agent"):
         self.agent_id = agent_id
         self._config: dict = {}
+        
+        # Bound handlers indexed by EventType value, built once instead of per event
+        handlers = {
+            EventType.SEND_MESSAGE: self.on_send_message,
+            EventType.SEND_OFFER: self.on_send_offer,
+            EventType.SEND_EXPRESSION: self.on_send_expression,
+            EventType.OFFER_IN_PROGRESS: self.on_offer_in_progress,
+            EventType.TIME: self.on_time,
+            EventType.FORMAL_ACCEPT: self.on_formal_accept,
+            EventType.GAME_START: self.on_game_start,
+            EventType.GAME_END: self.on_game_end,
+        }
+        self._handlers = tuple(handlers[event_type] for event_type in EventType)
     
     def configure(self, config: dict) -> None:
         """
@@ -47,30 +64,16 @@ class NegotiationAgent(ABC):
     
     # Main dispatch method
     
-    def handle_event(self, ctx: AgentContext, event: Event) -> list[Action]:
+    def handle_event(self, ctx: AgentContext, event: Event) -> Sequence[Action]:
         """
         Main entry point for handling events.
         
         Dispatches to the appropriate handler based on event type.
         Override specific on_* methods, not this one.
-        """
-        handlers = {
-            EventType.SEND_MESSAGE: self.on_send_message,
-            EventType.SEND_OFFER: self.on_send_offer,
-            EventType.SEND_EXPRESSION: self.on_send_expression,
-            EventType.OFFER_IN_PROGRESS: self.on_offer_in_progress,
-            EventType.TIME: self.on_time,
-            EventType.FORMAL_ACCEPT: self.on_formal_accept,
-            EventType.GAME_START: self.on_game_start,
-            EventType.GAME_END: self.on_game_end,
-        }
-        
-        handler = handlers.get(event.event_type)
-        if handler:
-            result = handler(ctx, event)
-            return result if result else []
         
-        return []
+        Returns a shared empty tuple when there is nothing to do.
+        """
+        return self._handlers[event.event_type](ctx, event) or _NO_ACTIONS
     
     # Event handlers - override these in subclasses
     
@@ -185,25 +188,19 @@ class SimpleAgent(NegotiationAgent):
         self.greeting = greeting
     
     def on_game_start(self, ctx: AgentContext, event: Event) -> list[Action]:
-        from .actions import SendMessage, SendExpression
-        from ..core.events import Expression, MessageSubtype
-        
         return [
-            SendExpression(Expression.HAPPY, duration_ms=1500),
+            SendExpression.of(Expression.HAPPY, duration_ms=1500),
             SendMessage(self.greeting, subtype=MessageSubtype.GREETING),
         ]
     
     def on_send_offer(self, ctx: AgentContext, event: Event) -> list[Action]:
-        from .actions import SendMessage, FormalAccept
-        from ..core.events import MessageSubtype
-        
         utility_pct = ctx.get_agent_utility_percent()
         
         if utility_pct >= self.min_utility_percent:
             if ctx.can_formally_accept():
                 return [
                     SendMessage("That works for me!", subtype=MessageSubtype.OFFER_ACCEPT),
-                    FormalAccept(),
+                    FormalAccept.of(),
                 ]
             else:
                 return [
@@ -217,16 +214,11 @@ class SimpleAgent(NegotiationAgent):
             ]
     
     def on_send_expression(self, ctx: AgentContext, event: Event) -> list[Action]:
-        from .actions import SendExpression
-        from ..core.events import Expression
-        
         # Mirror the expression
-        expr_str = event.get_expression()
-        try:
-            expr = Expression(expr_str)
-            return [SendExpression(expr, duration_ms=1500)]
-        except ValueError:
+        expr = Expression.parse(event.get_expression())
+        if expr is None:
             return []
+        return [SendExpression.of(expr, duration_ms=1500)]
     
     def get_description(self) -> str:
         return f"Simple agent that accepts offers with >{self.min_utility_percent}% utility"
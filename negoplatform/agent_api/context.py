@@ -5,15 +5,15 @@ Provides agents with all the information they need to make decisions
 without giving them direct access to modify session state.
 """
 
-from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..domain.models import GameSpec, Offer, Issue, UtilityFunction
     from ..core.session import NegotiationHistory
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """
     Read-only context provided to agents on each event.
@@ -49,22 +49,53 @@ class AgentContext:
     session_id: str
     game_index: int = 0  # For repeated games
     
-    # Convenience properties
-    
-    @property
-    def issues(self) -> list["Issue"]:
-        """Get all issues in the game."""
-        return self.game.issues
-    
-    @property
-    def issue_names(self) -> list[str]:
-        """Get names of all issues."""
-        return self.game.get_issue_names()
+    # Lazily computed caches (issues don't change during the context's life)
+    _max_agent_utility: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _max_opponent_utility: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _agent_preference_order: Optional[list[str]] = field(default=None, init=False, repr=False, compare=False)
+    _opponent_preference_order: Optional[list[str]] = field(default=None, init=False, repr=False, compare=False)
+    _agent_best_issue: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _agent_worst_issue: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Game shape, fixed for the context's life (set in __post_init__)
+    issues: list["Issue"] = field(init=False, repr=False, compare=False)
+    issue_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    num_issues: int = field(init=False, repr=False, compare=False)
+    
+    # Bound utility calculators, resolved once instead of on every call
+    _calc_agent: Callable[["Offer"], float] = field(init=False, repr=False, compare=False)
+    _calc_opponent: Callable[["Offer"], float] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._calc_agent = self.agent_utility.calculate
+        self._calc_opponent = self.opponent_utility.calculate
+        self.issues = self.game.issues
+        self.issue_names = tuple(self.game.get_issue_names())
+        self.num_issues = len(self.issues)
+    
+    def update(
+        self,
+        current_offer: "Offer",
+        elapsed_seconds: float,
+        remaining_seconds: Optional[float],
+        human_has_accepted: bool,
+        agent_has_accepted: bool,
+    ) -> None:
+        """
+        Refresh the per-event state in place.
+        
+        Lets a session keep one context alive instead of building a new
+        one for every event. Cached values only depend on the game and
+        utility functions, so they stay valid. Agents should not hold on
+        to a context between events.
+        """
+        self.current_offer = current_offer
+        self.elapsed_seconds = elapsed_seconds
+        self.remaining_seconds = remaining_seconds
+        self.human_has_accepted = human_has_accepted
+        self.agent_has_accepted = agent_has_accepted
     
-    @property
-    def num_issues(self) -> int:
-        """Get number of issues."""
-        return len(self.game.issues)
+    # Convenience lookups
     
     def get_issue(self, name: str) -> Optional["Issue"]:
         """Get issue by name."""
@@ -74,21 +105,23 @@ class AgentContext:
     
     def get_agent_utility(self, offer: Optional["Offer"] = None) -> float:
         """Calculate agent's utility for an offer."""
-        offer = offer or self.current_offer
-        return self.agent_utility.calculate(offer)
+        return self._calc_agent(offer if offer is not None else self.current_offer)
     
     def get_opponent_utility(self, offer: Optional["Offer"] = None) -> float:
         """Calculate opponent's utility for an offer."""
-        offer = offer or self.current_offer
-        return self.opponent_utility.calculate(offer)
+        return self._calc_opponent(offer if offer is not None else self.current_offer)
     
     def get_max_agent_utility(self) -> float:
         """Get maximum possible agent utility."""
-        return self.agent_utility.get_max_possible(self.game.issues)
+        if self._max_agent_utility is None:
+            self._max_agent_utility = self.agent_utility.get_max_possible(self.game.issues)
+        return self._max_agent_utility
     
     def get_max_opponent_utility(self) -> float:
         """Get maximum possible opponent utility."""
-        return self.opponent_utility.get_max_possible(self.game.issues)
+        if self._max_opponent_utility is None:
+            self._max_opponent_utility = self.opponent_utility.get_max_possible(self.game.issues)
+        return self._max_opponent_utility
     
     def get_agent_utility_percent(self, offer: Optional["Offer"] = None) -> float:
         """Get agent utility as percentage of max."""
@@ -107,20 +140,20 @@ class AgentContext:
     # History queries
     
     def get_last_human_offer(self) -> Optional["Offer"]:
-        """Get the last offer made by the human."""
-        from ..domain.models import Offer
+        """Get the last offer made by the human (a copy; safe to modify)."""
         event = self.history.get_last_human_offer()
-        if event and event.get_offer():
-            return Offer.from_dict(event.get_offer())
-        return None
+        if event is None:
+            return None
+        offer = event.get_offer_object()
+        return offer.copy() if offer is not None else None
     
     def get_last_agent_offer(self) -> Optional["Offer"]:
-        """Get the last offer made by the agent."""
-        from ..domain.models import Offer
+        """Get the last offer made by the agent (a copy; safe to modify)."""
         event = self.history.get_last_agent_offer()
-        if event and event.get_offer():
-            return Offer.from_dict(event.get_offer())
-        return None
+        if event is None:
+            return None
+        offer = event.get_offer_object()
+        return offer.copy() if offer is not None else None
     
     def get_offer_count(self) -> int:
         """Get total number of offers made."""
@@ -128,19 +161,13 @@ class AgentContext:
     
     def get_human_offer_count(self) -> int:
         """Get number of offers made by human."""
-        from ..core.events import EventType, HUMAN_ID
-        return len([
-            e for e in self.history.get_by_type(EventType.SEND_OFFER)
-            if e.sender_id == HUMAN_ID
-        ])
+        from ..core.events import HUMAN_ID
+        return self.history.get_offer_count_by(HUMAN_ID)
     
     def get_agent_offer_count(self) -> int:
         """Get number of offers made by agent."""
-        from ..core.events import EventType, AGENT_ID
-        return len([
-            e for e in self.history.get_by_type(EventType.SEND_OFFER)
-            if e.sender_id == AGENT_ID
-        ])
+        from ..core.events import AGENT_ID
+        return self.history.get_offer_count_by(AGENT_ID)
     
     def get_time_since_last_action(self) -> Optional[float]:
         """Get seconds since last non-TIME event."""
@@ -150,12 +177,11 @@ class AgentContext:
     
     def is_offer_complete(self, offer: Optional["Offer"] = None) -> bool:
         """Check if offer has all items allocated for all game issues."""
-        offer = offer or self.current_offer
-        for issue in self.game.issues:
-            alloc = offer[issue.name]
-            if alloc is None:
-                return False
-            if not alloc.is_complete():
+        offer = offer if offer is not None else self.current_offer
+        allocations = offer.allocations
+        for name in self.issue_names:
+            alloc = allocations.get(name)
+            if alloc is None or alloc.middle:
                 return False
         return True
     
@@ -165,11 +191,8 @@ class AgentContext:
         Requires all game issues to have allocations (can be partial - 
         items in middle are allowed and won't contribute to either party's score).
         """
-        for issue in self.game.issues:
-            alloc = self.current_offer[issue.name]
-            if alloc is None:
-                return False
-        return True
+        # Allocations are always truthy, so all() only fails on a None
+        return all(map(self.current_offer.allocations.get, self.issue_names))
     
     def is_offer_acceptable(
         self, 
@@ -200,23 +223,39 @@ class AgentContext:
             self.get_agent_utility(offer2),
         )
     
+    def rank_offers(self, offers: Sequence["Offer"]) -> list[float]:
+        """
+        Evaluate many candidate offers from agent's perspective.
+        
+        Returns agent utilities in the same order as offers.
+        """
+        return list(map(self._calc_agent, offers))
+    
     # Preference analysis
     
     def get_agent_preference_order(self) -> list[str]:
-        """Get issues sorted by agent's preference (highest first)."""
-        return self.agent_utility.get_issue_priority()
+        """Get issues sorted by agent's preference (highest first; shared list)."""
+        if self._agent_preference_order is None:
+            self._agent_preference_order = self.agent_utility.get_issue_priority()
+        return self._agent_preference_order
     
     def get_opponent_preference_order(self) -> list[str]:
-        """Get issues sorted by opponent's preference (highest first)."""
-        return self.opponent_utility.get_issue_priority()
+        """Get issues sorted by opponent's preference (highest first; shared list)."""
+        if self._opponent_preference_order is None:
+            self._opponent_preference_order = self.opponent_utility.get_issue_priority()
+        return self._opponent_preference_order
     
     def get_agent_best_issue(self) -> str:
         """Get the issue agent values most."""
-        return self.agent_utility.get_best_issue()
+        if self._agent_best_issue is None:
+            self._agent_best_issue = self.agent_utility.get_best_issue()
+        return self._agent_best_issue
     
     def get_agent_worst_issue(self) -> str:
         """Get the issue agent values least."""
-        return self.agent_utility.get_worst_issue()
+        if self._agent_worst_issue is None:
+            self._agent_worst_issue = self.agent_utility.get_worst_issue()
+        return self._agent_worst_issue
     
     def get_display_name(self, issue_name: str, plural: bool = True) -> str:
         """Get human-readable name for an issue."""
@@ -13,7 +13,6 @@ from ...agent_api.actions import (
 )
 from ...agent_api.context import AgentContext
 from ...core.events import Event, EventType, MessageSubtype, Expression
-from ...domain.models import Offer
 
 from .negochat_core import NegoChatCore, StackStrategy
 from .templates import NegoChatTemplates
@@ -55,6 +54,16 @@ class NegoChatAgent(NegotiationAgent):
         self._time_ticks_since_action: int = 0
         self._consecutive_bad_offers: int = 0
     
+    @property
+    def min_acceptable_utility(self) -> float:
+        """Minimum utility (fraction of max) for an offer to be acceptable."""
+        return self._min_acceptable_utility
+    
+    @min_acceptable_utility.setter
+    def min_acceptable_utility(self, value: float) -> None:
+        self._min_acceptable_utility = value
+        self._strong_reject_threshold = value * 0.5
+    
     def configure(self, config: dict) -> None:
         """Configure agent from dict."""
         super().configure(config)
@@ -84,24 +93,23 @@ class NegoChatAgent(NegotiationAgent):
         self._greeting_sent = False
         self._time_ticks_since_action = 0
         
-        actions = []
-        
-        # Greeting with smile
-        actions.append(SendExpression(Expression.HAPPY, duration_ms=1500))
-        actions.append(SendMessage(
-            self._templates.get_greeting(),
-            subtype=MessageSubtype.GREETING,
-            delay_ms=500,
-        ))
-        
-        # Opening offer
         opening = self._core.get_opening_offer()
-        actions.append(SendMessage(
-            f"{self._templates.get_opening_proposal()} {self._templates.describe_offer(opening)}",
-            subtype=MessageSubtype.OFFER_PROPOSE,
-            delay_ms=self.response_delay_ms,
-        ))
-        actions.append(SendOffer(opening, delay_ms=300))
+        actions = [
+            # Greeting with smile
+            SendExpression.of(Expression.HAPPY, duration_ms=1500),
+            SendMessage(
+                self._templates.get_greeting(),
+                subtype=MessageSubtype.GREETING,
+                delay_ms=500,
+            ),
+            # Opening offer
+            SendMessage(
+                f"{self._templates.get_opening_proposal()} {self._templates.describe_offer(opening)}",
+                subtype=MessageSubtype.OFFER_PROPOSE,
+                delay_ms=self.response_delay_ms,
+            ),
+            SendOffer(opening, delay_ms=300),
+        ]
         
         self._greeting_sent = True
         self._time_ticks_since_action = 0
@@ -116,12 +124,10 @@ class NegoChatAgent(NegotiationAgent):
         self._time_ticks_since_action = 0
         
         # Parse the incoming offer
-        offer_dict = event.get_offer()
-        if not offer_dict:
+        offer = event.get_offer_object()
+        if offer is None:
             return []
         
-        offer = Offer.from_dict(offer_dict)
-        
         # Check for unfairness/stubbornness
         utility_pct = ctx.get_agent_utility_percent(offer)
         
@@ -137,82 +143,86 @@ class NegoChatAgent(NegotiationAgent):
         should_be_angry = is_unfair or self._consecutive_bad_offers >= 2
         
         # Evaluate and respond
-        action, counter = self._core.handle_offer(offer, ctx)
+        action, counter, evaluation = self._core.handle_offer(offer, ctx)
         
-        actions = []
+        templates = self._templates
+        delay_ms = self.response_delay_ms
         
         if action == "accept":
             # Accept the offer
             if offer.is_complete():
-                actions.append(SendExpression(Expression.HAPPY, duration_ms=2000))
-                actions.append(SendMessage(
-                    self._templates.get_accept_text(is_complete=True),
-                    subtype=MessageSubtype.OFFER_ACCEPT,
-                    delay_ms=self.response_delay_ms,
-                ))
-                actions.append(FormalAccept(delay_ms=500))
+                actions = [
+                    SendExpression.of(Expression.HAPPY, duration_ms=2000),
+                    SendMessage(
+                        templates.get_accept_text(is_complete=True),
+                        subtype=MessageSubtype.OFFER_ACCEPT,
+                        delay_ms=delay_ms,
+                    ),
+                    FormalAccept.of(delay_ms=500),
+                ]
             else:
-                actions.append(SendMessage(
-                    self._templates.get_accept_text(is_complete=False),
+                actions = [SendMessage(
+                    templates.get_accept_text(is_complete=False),
                     subtype=MessageSubtype.OFFER_ACCEPT,
-                    delay_ms=self.response_delay_ms,
-                ))
+                    delay_ms=delay_ms,
+                )]
         
         elif action == "counter" and counter:
             # Counter-offer
-            evaluation = self._core.evaluate_offer(offer, ctx)
-            is_strong_reject = evaluation["utility_percent"] < self.min_acceptable_utility * 0.5
+            is_strong_reject = evaluation["utility_percent"] < self._strong_reject_threshold
             
             # Use ANGRY if unfair/stubborn, otherwise SAD for strong reject
             if should_be_angry:
-                actions.append(SendExpression(Expression.ANGRY, duration_ms=2500))
-            elif is_strong_reject:
-                actions.append(SendExpression(Expression.SAD, duration_ms=1500))
-            
-            # If angry, send a specific message about unfairness if possible, or standard reject
-            reject_text = self._templates.get_reject_text(strong=True)
-            if should_be_angry:
+                actions = [SendExpression.of(Expression.ANGRY, duration_ms=2500)]
                 reject_text = "That is simply not fair. I cannot accept that."
-
-            actions.append(SendMessage(
-                reject_text if should_be_angry else self._templates.get_reject_text(strong=is_strong_reject),
-                subtype=MessageSubtype.OFFER_REJECT,
-                delay_ms=self.response_delay_ms,
-            ))
-            actions.append(SendMessage(
-                f"{self._templates.get_counter_proposal()} {self._templates.describe_offer(counter)}",
-                subtype=MessageSubtype.OFFER_PROPOSE,
-                delay_ms=self.response_delay_ms,
+            else:
+                actions = [SendExpression.of(Expression.SAD, duration_ms=1500)] if is_strong_reject else []
+                reject_text = templates.get_reject_text(strong=is_strong_reject)
+            
+            actions.extend((
+                SendMessage(
+                    reject_text,
+                    subtype=MessageSubtype.OFFER_REJECT,
+                    delay_ms=delay_ms,
+                ),
+                SendMessage(
+                    f"{templates.get_counter_proposal()} {templates.describe_offer(counter)}",
+                    subtype=MessageSubtype.OFFER_PROPOSE,
+                    delay_ms=delay_ms,
+                ),
+                SendOffer(counter, delay_ms=300),
             ))
-            actions.append(SendOffer(counter, delay_ms=300))
         
         else:
             # Reject without counter
             # Use ANGRY if unfair/stubborn
             if should_be_angry:
-                actions.append(SendExpression(Expression.ANGRY, duration_ms=2500))
-            else:
-                actions.append(SendExpression(Expression.SAD, duration_ms=1500))
-
-            reject_text = self._templates.get_reject_text(strong=True)
-            if should_be_angry:
+                expression = SendExpression.of(Expression.ANGRY, duration_ms=2500)
                 reject_text = "I'm getting frustrated. You need to be more reasonable."
-
-            actions.append(SendMessage(
-                reject_text,
-                subtype=MessageSubtype.OFFER_REJECT,
-                delay_ms=self.response_delay_ms,
-            ))
+            else:
+                expression = SendExpression.of(Expression.SAD, duration_ms=1500)
+                reject_text = templates.get_reject_text(strong=True)
+            
+            actions = [
+                expression,
+                SendMessage(
+                    reject_text,
+                    subtype=MessageSubtype.OFFER_REJECT,
+                    delay_ms=delay_ms,
+                ),
+            ]
             
             # Try to make a concession
             concession = self._core._make_concession()
             if concession:
-                actions.append(SendMessage(
-                    f"{self._templates.get_concession_text()} {self._templates.describe_offer(concession)}",
-                    subtype=MessageSubtype.OFFER_PROPOSE,
-                    delay_ms=self.response_delay_ms * 2,
+                actions.extend((
+                    SendMessage(
+                        f"{templates.get_concession_text()} {templates.describe_offer(concession)}",
+                        subtype=MessageSubtype.OFFER_PROPOSE,
+                        delay_ms=delay_ms * 2,
+                    ),
+                    SendOffer(concession, delay_ms=300),
                 ))
-                actions.append(SendOffer(concession, delay_ms=300))
         
         return actions
     
@@ -262,18 +272,13 @@ class NegoChatAgent(NegotiationAgent):
             ))
             
             # Mirror emotion if enabled
-            if self.emotional_mirroring:
-                try:
-                    expr = Expression(expr_str)
-                    # Mirror or respond appropriately
-                    if expr == Expression.ANGRY:
-                        actions.append(SendExpression(Expression.NEUTRAL, duration_ms=1500))
-                    elif expr == Expression.SAD:
-                        actions.append(SendExpression(Expression.SAD, duration_ms=1500))
-                    else:
-                        actions.append(SendExpression(expr, duration_ms=1500))
-                except ValueError:
-                    pass
+            expr = Expression.parse(expr_str) if self.emotional_mirroring else None
+            if expr is not None:
+                # Mirror or respond appropriately
+                if expr is Expression.ANGRY:
+                    actions.append(SendExpression.of(Expression.NEUTRAL, duration_ms=1500))
+                else:
+                    actions.append(SendExpression.of(expr, duration_ms=1500))
         
         return actions
     
@@ -288,13 +293,13 @@ class NegoChatAgent(NegotiationAgent):
             utility_pct = ctx.get_agent_utility_percent()
             
             if utility_pct >= self.min_acceptable_utility:
-                actions.append(SendExpression(Expression.HAPPY, duration_ms=2000))
+                actions.append(SendExpression.of(Expression.HAPPY, duration_ms=2000))
                 actions.append(SendMessage(
                     self._templates.get_accept_text(is_complete=True) if self._templates else "Deal!",
                     subtype=MessageSubtype.OFFER_ACCEPT,
                     delay_ms=self.response_delay_ms,
                 ))
-                actions.append(FormalAccept(delay_ms=500))
+                actions.append(FormalAccept.of(delay_ms=500))
             else:
                 # Not good enough for us
                 actions.append(SendMessage(
@@ -346,9 +351,9 @@ class NegoChatAgent(NegotiationAgent):
             ))
         
         if success:
-            actions.append(SendExpression(Expression.HAPPY, duration_ms=3000))
+            actions.append(SendExpression.of(Expression.HAPPY, duration_ms=3000))
         else:
-            actions.append(SendExpression(Expression.SAD, duration_ms=2000))
+            actions.append(SendExpression.of(Expression.SAD, duration_ms=2000))
         
         return actions
     
@@ -25,29 +25,7 @@ class StackStrategy(Enum):
     COOPERATIVE = "cooperative"  # Consider opponent's needs more
 
 
-@dataclass
-class IssueAnalysis:
-    """Analysis of a single issue for stack building."""
-    issue_name: str
-    agent_value: float
-    opponent_value: float
-    quantity: int
-    
-    @property
-    def value_difference(self) -> float:
-        """Positive = agent values more, Negative = opponent values more."""
-        return self.agent_value - self.opponent_value
-    
-    @property
-    def total_agent_value(self) -> float:
-        return self.agent_value * self.quantity
-    
-    @property
-    def total_opponent_value(self) -> float:
-        return self.opponent_value * self.quantity
-
-
-@dataclass
+@dataclass(slots=True)
 class NegotiationStacks:
     """
     The two stacks used in NegoChat's issue-by-issue strategy.
@@ -90,8 +68,17 @@ class NegoChatCore:
         self.min_acceptable_utility = min_acceptable_utility
         self.concession_rate = concession_rate
         
+        # Per-issue values in game order, looked up once
+        self._issue_names = tuple(issue.name for issue in game.issues)
+        self._issue_index = {name: i for i, name in enumerate(self._issue_names)}
+        self._agent_vals = tuple(agent_utility.values.get(name, 0) for name in self._issue_names)
+        self._opp_vals = tuple(opponent_utility.values.get(name, 0) for name in self._issue_names)
+        self._quantity_of = {issue.name: issue.quantity for issue in game.issues}
+        self._agent_value_of = dict(zip(self._issue_names, self._agent_vals))
+        self._max_utility = agent_utility.get_max_possible(game.issues)
+        
         # Build stacks based on utilities
-        self.stacks = self._build_stacks()
+        self._init_stacks()
         
         # Track negotiation state
         self._current_proposal: Optional[Offer] = None
@@ -99,6 +86,31 @@ class NegoChatCore:
         self._concession_count = 0
         self._offers_made = 0
     
+    @property
+    def min_acceptable_utility(self) -> float:
+        """Minimum utility (fraction of max) for an offer to be acceptable."""
+        return self._min_acceptable_utility
+    
+    @min_acceptable_utility.setter
+    def min_acceptable_utility(self, value: float) -> None:
+        self._min_acceptable_utility = value
+        # Derived thresholds, kept in sync instead of recomputed per offer
+        self._mild_counter_threshold = value * 0.8
+        self._near_accept_threshold = value * 0.9
+    
+    def _init_stacks(self) -> None:
+        """Build the stacks and everything derived from them."""
+        self.stacks = self._build_stacks()
+        self._stacks_strategy = self.strategy
+        self._initial_stacks = (
+            tuple(self.stacks.stack_a),
+            tuple(self.stacks.stack_b),
+            tuple(self.stacks.neutral),
+        )
+        self._concession_order = self._build_concession_order()
+        self._stack_a_set = frozenset(self.stacks.stack_a)
+        self._stack_b_set = frozenset(self.stacks.stack_b)
+    
     def _build_stacks(self) -> NegotiationStacks:
         """
         Build Stack A and Stack B based on value differences.
@@ -106,50 +118,50 @@ class NegoChatCore:
         Stack A: Issues where agent_value > opponent_value
         Stack B: Issues where opponent_value > agent_value
         """
-        analyses = []
-        
-        for issue in self.game.issues:
-            agent_val = self.agent_utility.values.get(issue.name, 0)
-            opp_val = self.opponent_utility.values.get(issue.name, 0)
-            
-            analyses.append(IssueAnalysis(
-                issue_name=issue.name,
-                agent_value=agent_val,
-                opponent_value=opp_val,
-                quantity=issue.quantity,
-            ))
-        
-        # Sort by value difference
-        analyses.sort(key=lambda a: a.value_difference, reverse=True)
-        
-        stacks = NegotiationStacks()
-        
-        for analysis in analyses:
-            if analysis.value_difference > 0:
-                stacks.stack_a.append(analysis.issue_name)
-            elif analysis.value_difference < 0:
-                stacks.stack_b.append(analysis.issue_name)
+        names = self._issue_names
+        diffs = [a - o for a, o in zip(self._agent_vals, self._opp_vals)]
+        
+        # Work on issue indices so sort keys are plain tuple lookups
+        a_idx: list[int] = []
+        b_idx: list[int] = []
+        neutral_idx: list[int] = []
+        
+        # Largest difference first (stable, so ties keep game order)
+        for i in sorted(range(len(names)), key=diffs.__getitem__, reverse=True):
+            if diffs[i] > 0:
+                a_idx.append(i)
+            elif diffs[i] < 0:
+                b_idx.append(i)
             else:
-                stacks.neutral.append(analysis.issue_name)
+                neutral_idx.append(i)
         
         # Order within stacks based on strategy
-        if self.strategy == StackStrategy.AGGRESSIVE:
+        if self.strategy is StackStrategy.AGGRESSIVE:
             # Most valuable to agent first
-            stacks.stack_a.sort(
-                key=lambda n: self.agent_utility.values.get(n, 0), 
-                reverse=True
-            )
-            stacks.stack_b.sort(
-                key=lambda n: self.agent_utility.values.get(n, 0), 
-                reverse=True
-            )
-        elif self.strategy == StackStrategy.COOPERATIVE:
+            a_idx.sort(key=self._agent_vals.__getitem__, reverse=True)
+            b_idx.sort(key=self._agent_vals.__getitem__, reverse=True)
+        elif self.strategy is StackStrategy.COOPERATIVE:
             # Issues opponent values less first (easier trades)
-            stacks.stack_b.sort(
-                key=lambda n: self.opponent_utility.values.get(n, 0)
-            )
+            b_idx.sort(key=self._opp_vals.__getitem__)
         
-        return stacks
+        return NegotiationStacks(
+            stack_a=[names[i] for i in a_idx],
+            stack_b=[names[i] for i in b_idx],
+            neutral=[names[i] for i in neutral_idx],
+        )
+    
+    def _build_concession_order(self) -> tuple[tuple[str, bool], ...]:
+        """
+        Flatten the concession preference into (issue_name, allow_middle) pairs.
+        
+        Stack B first (middle items may go too), then neutral issues,
+        then Stack A least valuable first.
+        """
+        known = set(self._issue_names)
+        order = [(name, True) for name in self.stacks.stack_b]
+        order += [(name, False) for name in self.stacks.neutral]
+        order += [(name, False) for name in reversed(self.stacks.stack_a)]
+        return tuple(pair for pair in order if pair[0] in known)
     
     def get_opening_offer(self) -> Offer:
         """
@@ -160,12 +172,12 @@ class NegoChatCore:
         offer = Offer()
         
         for issue in self.game.issues:
-            if issue.name in self.stacks.stack_a:
+            if issue.name in self._stack_a_set:
                 # We want these - start by claiming all
                 offer[issue.name] = Allocation.all_to_agent(issue.quantity)
-            elif issue.name in self.stacks.stack_b:
+            elif issue.name in self._stack_b_set:
                 # They want these - offer some to show good faith
-                if self.strategy == StackStrategy.COOPERATIVE:
+                if self.strategy is StackStrategy.COOPERATIVE:
                     offer[issue.name] = Allocation.all_to_human(issue.quantity)
                 else:
                     offer[issue.name] = Allocation.split_even(issue.quantity)
@@ -199,78 +211,23 @@ class NegoChatCore:
         if self._current_proposal is None:
             return self.get_opening_offer()
         
-        offer = self._current_proposal.copy()
-        made_change = False
+        proposal = self._current_proposal
+        allocation_of = proposal.allocations.get
         
-        # Try to concede from Stack B (issues opponent wants)
-        for issue_name in self.stacks.stack_b:
-            issue = self.game.get_issue(issue_name)
-            if issue is None:
-                continue
-            
-            current = offer[issue_name]
+        # Give one item to opponent from the first issue that allows it
+        for issue_name, allow_middle in self._concession_order:
+            current = allocation_of(issue_name)
             if current is None:
                 continue
             
-            # If we still have some, give one to opponent
             if current.agent > 0:
-                offer[issue_name] = Allocation(
-                    agent=current.agent - 1,
-                    middle=current.middle,
-                    human=current.human + 1,
-                )
-                made_change = True
-                break
-            elif current.middle > 0:
-                offer[issue_name] = Allocation(
-                    agent=current.agent,
-                    middle=current.middle - 1,
-                    human=current.human + 1,
-                )
-                made_change = True
-                break
-        
-        # If couldn't concede from B, try neutral issues
-        if not made_change:
-            for issue_name in self.stacks.neutral:
-                issue = self.game.get_issue(issue_name)
-                if issue is None:
-                    continue
-                
-                current = offer[issue_name]
-                if current is None:
-                    continue
-                
-                if current.agent > 0:
-                    offer[issue_name] = Allocation(
-                        agent=current.agent - 1,
-                        middle=current.middle,
-                        human=current.human + 1,
-                    )
-                    made_change = True
-                    break
-        
-        # Last resort: concede from Stack A
-        if not made_change:
-            for issue_name in reversed(self.stacks.stack_a):  # Least valuable first
-                issue = self.game.get_issue(issue_name)
-                if issue is None:
-                    continue
-                
-                current = offer[issue_name]
-                if current is None:
-                    continue
-                
-                if current.agent > 0:
-                    offer[issue_name] = Allocation(
-                        agent=current.agent - 1,
-                        middle=current.middle,
-                        human=current.human + 1,
-                    )
-                    made_change = True
-                    break
-        
-        if made_change:
+                conceded = Allocation.of(current.agent - 1, current.middle, current.human + 1)
+            elif allow_middle and current.middle > 0:
+                conceded = Allocation.of(current.agent, current.middle - 1, current.human + 1)
+            else:
+                continue
+            
+            offer = proposal.with_allocation(issue_name, conceded)
             self._current_proposal = offer
             self._concession_count += 1
             self._offers_made += 1
@@ -278,7 +235,13 @@ class NegoChatCore:
         
         return None  # No more concessions possible
     
-    def evaluate_offer(self, offer: Offer, ctx: AgentContext) -> dict:
+    def evaluate_offer(
+        self,
+        offer: Offer,
+        ctx: AgentContext,
+        *,
+        detailed: bool = False,
+    ) -> dict:
         """
         Evaluate an incoming offer.
         
@@ -287,123 +250,119 @@ class NegoChatCore:
         - utility: float
         - utility_percent: float
         - recommendation: str (accept/reject/counter)
-        - issues_analysis: dict per issue
+        - issues_analysis: dict per issue (only if detailed)
         """
         utility = self.agent_utility.calculate(offer)
-        max_utility = self.agent_utility.get_max_possible(self.game.issues)
+        max_utility = self._max_utility
         utility_percent = (utility / max_utility) if max_utility > 0 else 0
         
-        # Analyze each issue
-        issues_analysis = {}
-        for issue in self.game.issues:
-            alloc = offer[issue.name]
-            if alloc:
-                agent_value = alloc.agent * self.agent_utility.values.get(issue.name, 0)
-                issues_analysis[issue.name] = {
-                    "agent_gets": alloc.agent,
-                    "human_gets": alloc.human,
-                    "undecided": alloc.middle,
-                    "agent_value": agent_value,
-                }
-        
         # Determine recommendation
-        acceptable = utility_percent >= self.min_acceptable_utility
+        acceptable = utility_percent >= self._min_acceptable_utility
         
         if acceptable and offer.is_complete():
             recommendation = "accept"
-        elif utility_percent >= self.min_acceptable_utility * 0.8:
+        elif utility_percent >= self._mild_counter_threshold:
             recommendation = "counter_mild"  # Small counter
         else:
             recommendation = "counter_strong"  # Need significant change
         
-        return {
+        evaluation = {
             "acceptable": acceptable,
             "utility": utility,
             "utility_percent": utility_percent,
             "max_utility": max_utility,
             "recommendation": recommendation,
-            "issues_analysis": issues_analysis,
         }
+        
+        if detailed:
+            # Per-issue breakdown in offer order, for callers that display or log it
+            issue_index = self._issue_index
+            issues_analysis = {}
+            for issue_name, alloc in offer.items():
+                i = issue_index.get(issue_name)
+                if i is not None and alloc is not None:
+                    issues_analysis[issue_name] = {
+                        "agent_gets": alloc.agent,
+                        "human_gets": alloc.human,
+                        "undecided": alloc.middle,
+                        "agent_value": alloc.agent * self._agent_vals[i],
+                    }
+            evaluation["issues_analysis"] = issues_analysis
+        
+        return evaluation
     
-    def handle_offer(self, offer: Offer, ctx: AgentContext) -> tuple[str, Optional[Offer]]:
+    def handle_offer(self, offer: Offer, ctx: AgentContext) -> tuple[str, Optional[Offer], dict]:
         """
         Handle an incoming offer from opponent.
         
         Returns:
-            (action, counter_offer) where action is 'accept', 'reject', or 'counter'
+            (action, counter_offer, evaluation) where action is 'accept',
+            'reject', or 'counter' and evaluation is from evaluate_offer
         """
         self._last_opponent_offer = offer
         evaluation = self.evaluate_offer(offer, ctx)
         
         if evaluation["recommendation"] == "accept":
-            return ("accept", None)
+            return ("accept", None, evaluation)
         
         # Generate counter-offer
         counter = self._generate_counter(offer, evaluation)
         
         if counter is None:
             # Can't generate better counter, consider accepting or rejecting
-            if evaluation["utility_percent"] >= self.min_acceptable_utility * 0.9:
-                return ("accept", None)
-            return ("reject", None)
+            if evaluation["utility_percent"] >= self._near_accept_threshold:
+                return ("accept", None, evaluation)
+            return ("reject", None, evaluation)
         
-        return ("counter", counter)
+        return ("counter", counter, evaluation)
     
     def _generate_counter(self, opponent_offer: Offer, evaluation: dict) -> Optional[Offer]:
         """
         Generate a counter-offer to opponent's proposal.
         
         Strategy: Start from opponent's offer and adjust toward our preferences.
+        Scores every eligible single-issue change and keeps the best: take
+        back the Stack A issues worth most to us, then give away the
+        Stack B issues that cost us least.
         """
-        counter = opponent_offer.copy()
-        changes_made = 0
+        changes: dict[str, Allocation] = {}
         max_changes = 2  # Don't change too much at once
+        allocation_of = opponent_offer.allocations.get
+        quantity_of = self._quantity_of.get
+        agent_value_of = self._agent_value_of.__getitem__
         
-        # Try to improve on Stack A issues
+        # Stack A issues where opponent gave themselves some we could take back
+        take_backs = []
         for issue_name in self.stacks.stack_a:
-            if changes_made >= max_changes:
-                break
-            
-            issue = self.game.get_issue(issue_name)
-            if issue is None:
-                continue
-            
-            alloc = counter[issue_name]
-            if alloc is None:
-                continue
-            
-            # If opponent gave themselves some, try to take it back
-            if alloc.human > 0 and alloc.agent < issue.quantity:
-                counter[issue_name] = Allocation(
-                    agent=alloc.agent + 1,
-                    middle=alloc.middle,
-                    human=alloc.human - 1,
-                )
-                changes_made += 1
+            quantity = quantity_of(issue_name)
+            alloc = allocation_of(issue_name)
+            if quantity is not None and alloc is not None:
+                if alloc.human > 0 and alloc.agent < quantity:
+                    take_backs.append(issue_name)
+        
+        # Take back what we value most (stable, so ties keep stack order)
+        take_backs.sort(key=agent_value_of, reverse=True)
+        for issue_name in take_backs[:max_changes]:
+            alloc = allocation_of(issue_name)
+            changes[issue_name] = Allocation.of(alloc.agent + 1, alloc.middle, alloc.human - 1)
         
         # Offer something from Stack B as compensation
-        for issue_name in self.stacks.stack_b:
-            if changes_made >= max_changes:
-                break
-            
-            issue = self.game.get_issue(issue_name)
-            if issue is None:
-                continue
+        if len(changes) < max_changes:
+            give_aways = []
+            for issue_name in self.stacks.stack_b:
+                alloc = allocation_of(issue_name)
+                if alloc is not None and issue_name in self._quantity_of and alloc.agent > 0:
+                    give_aways.append(issue_name)
             
-            alloc = counter[issue_name]
-            if alloc is None:
-                continue
-            
-            # Give opponent more of what they want
-            if alloc.agent > 0:
-                counter[issue_name] = Allocation(
-                    agent=alloc.agent - 1,
-                    middle=alloc.middle,
-                    human=alloc.human + 1,
-                )
-                changes_made += 1
-        
-        if changes_made > 0:
+            # Give away what costs us least
+            give_aways.sort(key=agent_value_of)
+            for issue_name in give_aways[:max_changes - len(changes)]:
+                alloc = allocation_of(issue_name)
+                changes[issue_name] = Allocation.of(alloc.agent - 1, alloc.middle, alloc.human + 1)
+        
+        if changes:
+            # Stacks are disjoint, so each issue changes at most once
+            counter = opponent_offer.with_allocations(changes)
             self._current_proposal = counter
             self._offers_made += 1
             return counter
@@ -412,7 +371,16 @@ class NegoChatCore:
     
     def reset(self) -> None:
         """Reset for a new negotiation."""
-        self.stacks = self._build_stacks()
+        if self.strategy is self._stacks_strategy:
+            # Utilities are unchanged, so restore the stacks rather than rebuild
+            stack_a, stack_b, neutral = self._initial_stacks
+            self.stacks = NegotiationStacks(
+                stack_a=list(stack_a),
+                stack_b=list(stack_b),
+                neutral=list(neutral),
+            )
+        else:
+            self._init_stacks()
         self._current_proposal = None
         self._last_opponent_offer = None
         self._concession_count = 0
@@ -8,22 +8,27 @@ delayed execution of agent responses.
 from collections import defaultdict
 from typing import Callable, Optional
 from dataclasses import dataclass
+import heapq
+import itertools
+import logging
 import threading
-import queue
 import time
 
 from .events import Event, EventType
 
 
+logger = logging.getLogger(__name__)
+
+
 # Type alias for event handlers
 EventHandler = Callable[[Event], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     """Represents a subscription to events."""
     handler: EventHandler
-    event_types: Optional[set[EventType]]  # None means all types
+    event_types: Optional[frozenset[EventType]]  # None means all types
     subscriber_id: str
 
 
@@ -36,12 +41,24 @@ class EventBus:
     - Support for delayed event execution
     - Thread-safe operation for GUI integration
     - Event filtering by type
+    
+    With safe_dispatch (the default) a failing handler is logged via
+    logger.exception and the remaining handlers still run; without it
+    exceptions propagate to the publisher.
     """
     
-    def __init__(self):
-        self._subscriptions: list[Subscription] = []
-        self._delayed_queue: queue.PriorityQueue = queue.PriorityQueue()
+    def __init__(self, safe_dispatch: bool = True):
+        self._safe_dispatch = safe_dispatch
+        # Copy-on-write: replaced (never mutated) under the lock, read without it
+        self._subscriptions: tuple[Subscription, ...] = ()
+        # Matching subscriptions per EventType, in subscription order
+        self._by_type: tuple[tuple[Subscription, ...], ...] = tuple(() for _ in EventType)
+        # Min-heap of (execute_at, seq, event); seq breaks ties so events are never compared
+        self._delayed_heap: list[tuple[float, int, Event]] = []
+        self._seq = itertools.count()
         self._lock = threading.RLock()
+        # Wakes the delay processor when an event is queued or it is stopped
+        self._delayed_ready = threading.Condition(self._lock)
         self._running = False
         self._delay_thread: Optional[threading.Thread] = None
         
@@ -64,23 +81,34 @@ class EventBus:
         """
         with self._lock:
             # Remove any existing subscription with same ID
-            self._subscriptions = [
+            self._subscriptions = tuple(
                 s for s in self._subscriptions 
                 if s.subscriber_id != subscriber_id
-            ]
-            self._subscriptions.append(Subscription(
+            ) + (Subscription(
                 handler=handler,
-                event_types=event_types,
+                event_types=frozenset(event_types) if event_types is not None else None,
                 subscriber_id=subscriber_id,
-            ))
+            ),)
+            self._rebuild_index()
     
     def unsubscribe(self, subscriber_id: str) -> None:
         """Remove a subscriber."""
         with self._lock:
-            self._subscriptions = [
+            self._subscriptions = tuple(
                 s for s in self._subscriptions 
                 if s.subscriber_id != subscriber_id
-            ]
+            )
+            self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the per-type subscription index. Caller holds the lock."""
+        self._by_type = tuple(
+            tuple(
+                s for s in self._subscriptions
+                if s.event_types is None or event_type in s.event_types
+            )
+            for event_type in EventType
+        )
     
     def publish(self, event: Event) -> None:
         """
@@ -95,27 +123,51 @@ class EventBus:
             self._dispatch(event)
     
     def publish_all(self, events: list[Event]) -> None:
-        """Publish multiple events in order."""
+        """
+        Publish multiple events in order.
+        
+        Delayed events are queued under a single lock acquisition, then
+        immediate ones are dispatched.
+        """
+        immediate = []
+        delayed = []
         for event in events:
-            self.publish(event)
+            (delayed if event.delay_ms > 0 else immediate).append(event)
+        
+        if delayed:
+            now = time.monotonic()
+            with self._delayed_ready:
+                for event in delayed:
+                    heapq.heappush(
+                        self._delayed_heap,
+                        (now + event.delay_ms / 1000.0, next(self._seq), event),
+                    )
+                self._delayed_ready.notify()
+        
+        for event in immediate:
+            self._dispatch(event)
     
     def _dispatch(self, event: Event) -> None:
         """Immediately dispatch event to all matching subscribers."""
-        with self._lock:
-            subscribers = list(self._subscriptions)
+        # The index is replaced wholesale on (un)subscribe, so no lock or copy is needed
+        subscribers = self._by_type[event.event_type]
+        if not self._safe_dispatch:
+            for sub in subscribers:
+                sub.handler(event)
+            return
         
         for sub in subscribers:
-            if sub.event_types is None or event.event_type in sub.event_types:
-                try:
-                    sub.handler(event)
-                except Exception as e:
-                    print(f"Error in event handler {sub.subscriber_id}: {e}")
+            try:
+                sub.handler(event)
+            except Exception:
+                logger.exception("Error in event handler %s", sub.subscriber_id)
     
     def _queue_delayed(self, event: Event) -> None:
         """Queue an event for delayed execution."""
-        execute_at = time.time() + (event.delay_ms / 1000.0)
-        # Priority queue uses (priority, item) tuples
-        self._delayed_queue.put((execute_at, event))
+        execute_at = time.monotonic() + (event.delay_ms / 1000.0)
+        with self._delayed_ready:
+            heapq.heappush(self._delayed_heap, (execute_at, next(self._seq), event))
+            self._delayed_ready.notify()
     
     def process_delayed_events(self) -> list[Event]:
         """
@@ -125,23 +177,15 @@ class EventBus:
         Called by the GUI event loop or scheduler.
         """
         dispatched = []
-        now = time.time()
+        now = time.monotonic()
+        heap = self._delayed_heap
         
-        while not self._delayed_queue.empty():
-            try:
-                # Peek at the next event
-                execute_at, event = self._delayed_queue.get_nowait()
-                
-                if execute_at <= now:
-                    # Event is ready, dispatch it
-                    self._dispatch(event)
-                    dispatched.append(event)
-                else:
-                    # Not ready yet, put it back
-                    self._delayed_queue.put((execute_at, event))
-                    break
-            except queue.Empty:
-                break
+        with self._lock:
+            while heap and heap[0][0] <= now:
+                dispatched.append(heapq.heappop(heap)[2])
+        
+        for event in dispatched:
+            self._dispatch(event)
         
         return dispatched
     
@@ -150,26 +194,21 @@ class EventBus:
         Get time until next delayed event (in seconds).
         Returns None if no delayed events.
         """
-        try:
-            execute_at, event = self._delayed_queue.get_nowait()
-            self._delayed_queue.put((execute_at, event))
-            return max(0, execute_at - time.time())
-        except queue.Empty:
-            return None
+        with self._lock:
+            if not self._delayed_heap:
+                return None
+            execute_at = self._delayed_heap[0][0]
+        return max(0, execute_at - time.monotonic())
     
     def has_pending_delayed(self) -> bool:
         """Check if there are delayed events pending."""
-        return not self._delayed_queue.empty()
+        return bool(self._delayed_heap)
     
     def clear_delayed(self) -> int:
         """Clear all delayed events. Returns count cleared."""
-        count = 0
-        while not self._delayed_queue.empty():
-            try:
-                self._delayed_queue.get_nowait()
-                count += 1
-            except queue.Empty:
-                break
+        with self._lock:
+            count = len(self._delayed_heap)
+            self._delayed_heap.clear()
         return count
     
     def start_delay_processor(self, on_ready: Callable[[Event], None]) -> None:
@@ -186,7 +225,9 @@ class EventBus:
     
     def stop_delay_processor(self) -> None:
         """Stop the background delay processor."""
-        self._running = False
+        with self._delayed_ready:
+            self._running = False
+            self._delayed_ready.notify_all()
         if self._delay_thread:
             self._delay_thread.join(timeout=1.0)
             self._delay_thread = None
@@ -199,9 +240,17 @@ class EventBus:
                 if self._on_delayed_ready:
                     try:
                         self._on_delayed_ready(event)
-                    except Exception as e:
-                        print(f"Error in delayed event callback: {e}")
+                    except Exception:
+                        logger.exception("Error in delayed event callback")
             
-            # Sleep a bit before checking again
-            time.sleep(0.05)  # 50ms polling
+            # Sleep until the next event is due or a new one is queued
+            with self._delayed_ready:
+                if not self._running:
+                    break
+                if not self._delayed_heap:
+                    self._delayed_ready.wait()
+                else:
+                    wait_for = self._delayed_heap[0][0] - time.monotonic()
+                    if wait_for > 0:
+                        self._delayed_ready.wait(timeout=wait_for)
 
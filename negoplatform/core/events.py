@@ -12,22 +12,48 @@ Mirrors IAGO's event system:
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Any, Optional
+import itertools
+import os
+import sys
 import time
-import uuid
 
+from ..domain.models import Offer
 
-class EventType(Enum):
-    """Types of events in the negotiation system."""
-    SEND_MESSAGE = "send_message"
-    SEND_OFFER = "send_offer"
-    SEND_EXPRESSION = "send_expression"
-    OFFER_IN_PROGRESS = "offer_in_progress"
-    TIME = "time"
-    FORMAL_ACCEPT = "formal_accept"
-    GAME_START = "game_start"
-    GAME_END = "game_end"
+
+class EventType(IntEnum):
+    """
+    Types of events in the negotiation system.
+    
+    Values are contiguous from 0 so handlers can be looked up by index.
+    Serialized form is the lowercase name (see wire_name / from_wire).
+    """
+    SEND_MESSAGE = 0
+    SEND_OFFER = 1
+    SEND_EXPRESSION = 2
+    OFFER_IN_PROGRESS = 3
+    TIME = 4
+    FORMAL_ACCEPT = 5
+    GAME_START = 6
+    GAME_END = 7
+    
+    @property
+    def wire_name(self) -> str:
+        """Name used in logs and serialized events, e.g. "send_offer"."""
+        return _WIRE_NAMES[self]
+    
+    @classmethod
+    def from_wire(cls, wire_name: str) -> "EventType":
+        """Look up an event type by its serialized name."""
+        event_type = _EVENT_TYPE_BY_WIRE.get(wire_name)
+        if event_type is None:
+            event_type = cls[wire_name.upper()]
+        return event_type
+
+
+_WIRE_NAMES: tuple[str, ...] = tuple(t.name.lower() for t in EventType)
+_EVENT_TYPE_BY_WIRE: dict[str, EventType] = {t.wire_name: t for t in EventType}
 
 
 class MessageSubtype(Enum):
@@ -66,6 +92,9 @@ class MessageSubtype(Enum):
     CLARIFICATION = "clarification"
 
 
+_SUBTYPE_BY_VALUE: dict[str, MessageSubtype] = {s.value: s for s in MessageSubtype}
+
+
 class Expression(Enum):
     """
     Emotional expressions available.
@@ -83,17 +112,29 @@ class Expression(Enum):
     CONTEMPT = "contempt"
     
     @classmethod
-    def human_expressions(cls) -> list["Expression"]:
+    def human_expressions(cls) -> tuple["Expression", ...]:
         """Expressions available to human users."""
-        return [cls.NEUTRAL, cls.HAPPY, cls.SAD, cls.ANGRY, cls.SURPRISED]
+        return _HUMAN_EXPRESSIONS
     
     @classmethod
-    def agent_expressions(cls) -> list["Expression"]:
+    def agent_expressions(cls) -> tuple["Expression", ...]:
         """All expressions available to agents."""
-        return list(cls)
+        return _AGENT_EXPRESSIONS
+    
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional["Expression"]:
+        """Look up an expression by value; None if unknown (never raises)."""
+        return _EXPRESSION_BY_VALUE.get(value)
+
 
+_EXPRESSION_BY_VALUE: dict[str, Expression] = {e.value: e for e in Expression}
+_HUMAN_EXPRESSIONS = (
+    Expression.NEUTRAL, Expression.HAPPY, Expression.SAD, Expression.ANGRY, Expression.SURPRISED,
+)
+_AGENT_EXPRESSIONS = tuple(Expression)
 
-@dataclass
+
+@dataclass(slots=True)
 class Preference:
     """
     Structured preference information.
@@ -130,8 +171,18 @@ HUMAN_ID = "human"
 AGENT_ID = "agent"
 SYSTEM_ID = "system"
 
+# Shared payload for factory-built events that carry no data; never mutated
+_EMPTY_PAYLOAD: dict = {}
+
+# Event IDs: 8 hex digits from a counter with a random per-process start
+_event_ids = itertools.count(int.from_bytes(os.urandom(4), "big"))
+
 
-@dataclass
+def _next_event_id() -> str:
+    return f"{next(_event_ids) & 0xFFFFFFFF:08x}"
+
+
+@dataclass(slots=True)
 class Event:
     """
     A single event in the negotiation.
@@ -150,12 +201,15 @@ class Event:
     delay_ms: int = 0  # Milliseconds to wait before executing
     
     # Auto-generated fields
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    event_id: str = field(default_factory=_next_event_id)
     timestamp: float = field(default_factory=time.time)
     
     # Optional subtype for messages
     subtype: Optional[MessageSubtype] = None
     
+    # Materialized offer, built on first get_offer_object() call
+    _offer_obj: Optional[Offer] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         # Validate payload based on type
         pass
@@ -187,14 +241,23 @@ class Event:
         sender_id: str,
         offer_dict: dict,
         delay_ms: int = 0,
+        offer: Optional[Offer] = None,
     ) -> "Event":
-        """Create a SEND_OFFER event."""
-        return cls(
+        """
+        Create a SEND_OFFER event.
+        
+        If the sender already has the Offer behind offer_dict, passing it
+        lets get_offer_object() return it without re-parsing the dict; it
+        must not be modified afterwards.
+        """
+        event = cls(
             event_type=EventType.SEND_OFFER,
             sender_id=sender_id,
             payload={"offer": offer_dict},
             delay_ms=delay_ms,
         )
+        event._offer_obj = offer
+        return event
     
     @classmethod
     def send_expression(
@@ -219,9 +282,7 @@ class Event:
         partial_offer_dict: Optional[dict] = None,
     ) -> "Event":
         """Create an OFFER_IN_PROGRESS event."""
-        payload = {}
-        if partial_offer_dict:
-            payload["partial_offer"] = partial_offer_dict
+        payload = {"partial_offer": partial_offer_dict} if partial_offer_dict else _EMPTY_PAYLOAD
         return cls(
             event_type=EventType.OFFER_IN_PROGRESS,
             sender_id=sender_id,
@@ -246,7 +307,7 @@ class Event:
         return cls(
             event_type=EventType.FORMAL_ACCEPT,
             sender_id=sender_id,
-            payload={},
+            payload=_EMPTY_PAYLOAD,
             delay_ms=delay_ms,
         )
     
@@ -283,6 +344,19 @@ class Event:
             return self.payload.get("offer")
         return None
     
+    def get_offer_object(self) -> Optional[Offer]:
+        """
+        Get the offer as an Offer if this is a SEND_OFFER event.
+        
+        The Offer is built once and shared by later calls; copy() it
+        before modifying.
+        """
+        if self._offer_obj is None:
+            offer_dict = self.get_offer()
+            if offer_dict:
+                self._offer_obj = Offer.from_dict(offer_dict)
+        return self._offer_obj
+    
     def get_expression(self) -> Optional[str]:
         """Get expression value if this is a SEND_EXPRESSION event."""
         if self.event_type == EventType.SEND_EXPRESSION:
@@ -301,10 +375,10 @@ class Event:
         """Serialize event to dictionary for logging."""
         return {
             "event_id": self.event_id,
-            "event_type": self.event_type.value,
+            "event_type": self.event_type.wire_name,
             "sender_id": self.sender_id,
             "timestamp": self.timestamp,
-            "payload": self.payload,
+            "payload": self.payload if self.payload is not _EMPTY_PAYLOAD else {},
             "subtype": self.subtype.value if self.subtype else None,
             "delay_ms": self.delay_ms,
         }
@@ -314,11 +388,12 @@ class Event:
         """Deserialize event from dictionary."""
         return cls(
             event_id=data["event_id"],
-            event_type=EventType(data["event_type"]),
-            sender_id=data["sender_id"],
+            event_type=EventType.from_wire(data["event_type"]),
+            # Share one string per sender across replayed events
+            sender_id=sys.intern(data["sender_id"]),
             timestamp=data["timestamp"],
             payload=data.get("payload", {}),
-            subtype=MessageSubtype(data["subtype"]) if data.get("subtype") else None,
+            subtype=_SUBTYPE_BY_VALUE[data["subtype"]] if data.get("subtype") else None,
             delay_ms=data.get("delay_ms", 0),
         )
 
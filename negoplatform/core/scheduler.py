@@ -7,6 +7,9 @@ Handles:
 - Delayed action execution coordination
 """
 
+import heapq
+import itertools
+import logging
 import threading
 import time
 from typing import Callable, Optional
@@ -15,14 +18,17 @@ from dataclasses import dataclass
 from .events import Event, EventType
 from .bus import EventBus
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class ScheduledAction:
     """A scheduled action to be executed at a specific time."""
     execute_at: float
     action: Callable[[], None]
     action_id: str
     repeat_interval: Optional[float] = None  # For repeating actions
+    cancelled: bool = False  # Cancelled entries stay in the heap and are skipped
 
 
 class Scheduler:
@@ -46,12 +52,19 @@ class Scheduler:
         self._deadline = deadline_seconds
         
         self._start_time: Optional[float] = None
+        # Absolute monotonic deadline; None until started or without a deadline
+        self._deadline_at: Optional[float] = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
         
-        # Scheduled actions
-        self._actions: list[ScheduledAction] = []
+        # Scheduled actions: min-heap of (execute_at, seq, action), plus live
+        # actions by ID so cancelling marks entries instead of rebuilding the heap
+        self._actions: list[tuple[float, int, ScheduledAction]] = []
+        self._live_actions: dict[str, list[ScheduledAction]] = {}
+        self._seq = itertools.count()
         self._actions_lock = threading.Lock()
+        # Wakes the run loop early when a sooner wakeup appears or on stop
+        self._wakeup = threading.Condition(self._actions_lock)
         
         # Callbacks
         self._on_timeout: Optional[Callable[[], None]] = None
@@ -62,27 +75,42 @@ class Scheduler:
         if self._running:
             return
         
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        self._update_deadline_at()
         self._running = True
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
     
     def stop(self) -> None:
         """Stop the scheduler."""
-        self._running = False
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
     
     def reset(self) -> None:
         """Reset the scheduler for a new negotiation."""
-        self._start_time = time.time()
-        with self._actions_lock:
+        with self._wakeup:
+            self._start_time = time.monotonic()
+            self._update_deadline_at()
             self._actions.clear()
+            self._live_actions.clear()
+            self._wakeup.notify()
     
     def set_deadline(self, seconds: Optional[int]) -> None:
         """Set or update the deadline."""
-        self._deadline = seconds
+        with self._wakeup:
+            self._deadline = seconds
+            self._update_deadline_at()
+            self._wakeup.notify()
+    
+    def _update_deadline_at(self) -> None:
+        if self._deadline is None or self._start_time is None:
+            self._deadline_at = None
+        else:
+            self._deadline_at = self._start_time + self._deadline
     
     def set_on_timeout(self, callback: Callable[[], None]) -> None:
         """Set callback for when deadline is reached."""
@@ -96,18 +124,23 @@ class Scheduler:
         """Get elapsed time in seconds."""
         if self._start_time is None:
             return 0.0
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
     
     def get_remaining(self) -> Optional[float]:
         """Get remaining time in seconds, or None if no deadline."""
         if self._deadline is None:
             return None
-        return max(0, self._deadline - self.get_elapsed())
+        deadline_at = self._deadline_at
+        if deadline_at is None:
+            return max(0, self._deadline)
+        return max(0, deadline_at - time.monotonic())
     
     def is_timed_out(self) -> bool:
         """Check if deadline has been exceeded."""
-        remaining = self.get_remaining()
-        return remaining is not None and remaining <= 0
+        deadline_at = self._deadline_at
+        if deadline_at is not None:
+            return time.monotonic() >= deadline_at
+        return self._deadline is not None and self._deadline <= 0
     
     def schedule_action(
         self, 
@@ -121,7 +154,7 @@ class Scheduler:
         Returns the action ID.
         """
         action_id = action_id or f"action_{time.time()}"
-        execute_at = time.time() + (delay_ms / 1000.0)
+        execute_at = time.monotonic() + (delay_ms / 1000.0)
         
         scheduled = ScheduledAction(
             execute_at=execute_at,
@@ -129,38 +162,49 @@ class Scheduler:
             action_id=action_id,
         )
         
-        with self._actions_lock:
-            self._actions.append(scheduled)
-            self._actions.sort(key=lambda a: a.execute_at)
+        with self._wakeup:
+            heapq.heappush(self._actions, (execute_at, next(self._seq), scheduled))
+            self._live_actions.setdefault(action_id, []).append(scheduled)
+            if self._actions[0][2] is scheduled:
+                self._wakeup.notify()
         
         return action_id
     
     def cancel_action(self, action_id: str) -> bool:
         """Cancel a scheduled action. Returns True if found and cancelled."""
         with self._actions_lock:
-            original_len = len(self._actions)
-            self._actions = [a for a in self._actions if a.action_id != action_id]
-            return len(self._actions) < original_len
+            cancelled = self._live_actions.pop(action_id, None)
+            if not cancelled:
+                return False
+            for scheduled in cancelled:
+                scheduled.cancelled = True
+            return True
     
     def cancel_all_actions(self) -> int:
         """Cancel all scheduled actions. Returns count cancelled."""
         with self._actions_lock:
-            count = len(self._actions)
+            count = sum(len(actions) for actions in self._live_actions.values())
             self._actions.clear()
+            self._live_actions.clear()
             return count
     
     def _run_loop(self) -> None:
         """Main scheduler loop."""
-        last_tick = time.time()
+        monotonic = time.monotonic
+        process_actions = self._process_actions
+        tick_interval = self._tick_interval
+        wakeup = self._wakeup
+        actions = self._actions
+        last_tick = monotonic()
         
         while self._running:
-            now = time.time()
+            now = monotonic()
             
             # Process scheduled actions
-            self._process_actions(now)
+            process_actions(now)
             
             # Check for time tick
-            if now - last_tick >= self._tick_interval:
+            if now - last_tick >= tick_interval:
                 self._emit_time_tick()
                 last_tick = now
             
@@ -169,29 +213,49 @@ class Scheduler:
                 self._handle_timeout()
                 break
             
-            # Small sleep to avoid busy-waiting
-            time.sleep(0.05)
+            # Sleep until the next action, tick or deadline is due
+            with wakeup:
+                if not self._running:
+                    break
+                next_wake = last_tick + tick_interval
+                if actions:
+                    next_wake = min(next_wake, actions[0][0])
+                if self._deadline_at is not None:
+                    next_wake = min(next_wake, self._deadline_at)
+                timeout = next_wake - monotonic()
+                if timeout > 0:
+                    wakeup.wait(timeout)
     
     def _process_actions(self, now: float) -> None:
         """Execute any actions that are due."""
         actions_to_run = []
         
         with self._actions_lock:
-            # Find actions that are due
-            while self._actions and self._actions[0].execute_at <= now:
-                actions_to_run.append(self._actions.pop(0))
+            # Find actions that are due, skipping cancelled ones
+            heap = self._actions
+            while heap and heap[0][0] <= now:
+                scheduled = heapq.heappop(heap)[2]
+                if scheduled.cancelled:
+                    continue
+                live = self._live_actions[scheduled.action_id]
+                live.remove(scheduled)
+                if not live:
+                    del self._live_actions[scheduled.action_id]
+                actions_to_run.append(scheduled)
         
         # Execute outside the lock
         for action in actions_to_run:
             try:
                 action.action()
-            except Exception as e:
-                print(f"Error executing scheduled action {action.action_id}: {e}")
+            except Exception:
+                logger.exception("Error executing scheduled action %s", action.action_id)
     
     def _emit_time_tick(self) -> None:
         """Emit a TIME event."""
         elapsed = self.get_elapsed()
-        remaining = self.get_remaining()
+        remaining = None
+        if self._deadline is not None:
+            remaining = max(0, self._deadline - elapsed)
         
         # Publish TIME event
         event = Event.time_tick(elapsed, remaining)
@@ -201,8 +265,8 @@ class Scheduler:
         if self._on_tick:
             try:
                 self._on_tick(elapsed, remaining)
-            except Exception as e:
-                print(f"Error in tick callback: {e}")
+            except Exception:
+                logger.exception("Error in tick callback")
     
     def _handle_timeout(self) -> None:
         """Handle deadline timeout."""
@@ -216,8 +280,8 @@ class Scheduler:
         if self._on_timeout:
             try:
                 self._on_timeout()
-            except Exception as e:
-                print(f"Error in timeout callback: {e}")
+            except Exception:
+                logger.exception("Error in timeout callback")
 
 
 class TypingIndicator:
@@ -226,11 +290,21 @@ class TypingIndicator:
     
     Shows indicator when agent is processing, hides when they respond.
     Mirrors IAGO's OFFER_IN_PROGRESS indicator behavior.
+    
+    If a running Scheduler is given, auto-hide is scheduled on its thread
+    instead of starting a threading.Timer (one OS thread) per show.
     """
     
-    def __init__(self, event_bus: EventBus, sender_id: str = "agent"):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        sender_id: str = "agent",
+        scheduler: Optional[Scheduler] = None,
+    ):
         self._event_bus = event_bus
         self._sender_id = sender_id
+        self._scheduler = scheduler
+        self._hide_action_id = f"typing_hide_{sender_id}"
         self._is_showing = False
         self._hide_timer: Optional[threading.Timer] = None
     
@@ -248,6 +322,8 @@ class TypingIndicator:
     
     def hide(self) -> None:
         """Hide the typing indicator."""
+        if self._scheduler:
+            self._scheduler.cancel_action(self._hide_action_id)
         if self._hide_timer:
             self._hide_timer.cancel()
             self._hide_timer = None
@@ -257,6 +333,11 @@ class TypingIndicator:
     
     def _schedule_hide(self, delay_ms: int) -> None:
         """Schedule automatic hide."""
+        if self._scheduler:
+            self._scheduler.cancel_action(self._hide_action_id)
+            self._scheduler.schedule_action(delay_ms, self.hide, self._hide_action_id)
+            return
+        
         if self._hide_timer:
             self._hide_timer.cancel()
         
@@ -10,7 +10,7 @@ Tracks the state of a negotiation including:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 import time
 
 from ..domain.models import GameSpec, Offer, Party
@@ -26,7 +26,7 @@ class SessionState(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class FormalAcceptance:
     """Tracks formal acceptances."""
     human_accepted: bool = False
@@ -45,75 +45,116 @@ class FormalAcceptance:
         return self.human_accepted and self.agent_accepted
 
 
-@dataclass
+@dataclass(slots=True)
 class NegotiationHistory:
     """Maintains history of all events in the negotiation."""
     events: list[Event] = field(default_factory=list)
     
+    # Indices kept up to date by add(), so lookups don't rescan events
+    _by_type: list[list[Event]] = field(init=False, repr=False, compare=False)
+    _by_sender: dict[str, list[Event]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _last_offer_by_sender: dict[str, Event] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _offer_counts: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _last_non_time: Optional[Event] = field(default=None, init=False, repr=False, compare=False)
+    # Read-only snapshots handed out by the getters (None = all events), dropped on add()
+    _snapshots: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._by_type = [[] for _ in EventType]
+        for event in self.events:
+            self._index(event)
+    
+    def _index(self, event: Event) -> None:
+        event_type = event.event_type
+        sender_id = event.sender_id
+        self._by_type[event_type].append(event)
+        by_sender = self._by_sender.get(sender_id)
+        if by_sender is None:
+            by_sender = self._by_sender[sender_id] = []
+        by_sender.append(event)
+        if event_type == EventType.SEND_OFFER:
+            self._last_offer_by_sender[sender_id] = event
+            self._offer_counts[sender_id] = self._offer_counts.get(sender_id, 0) + 1
+        if event_type != EventType.TIME:
+            self._last_non_time = event
+    
     def add(self, event: Event) -> None:
         self.events.append(event)
+        self._index(event)
+        if self._snapshots:
+            self._snapshots.clear()
+    
+    def _snapshot(self, key, events: list[Event]) -> tuple[Event, ...]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = self._snapshots[key] = tuple(events)
+        return snapshot
     
-    def get_all(self) -> list[Event]:
-        return list(self.events)
+    def get_all(self) -> tuple[Event, ...]:
+        return self._snapshot(None, self.events)
     
-    def get_by_type(self, event_type: EventType) -> list[Event]:
-        return [e for e in self.events if e.event_type == event_type]
+    def get_by_type(self, event_type: EventType) -> tuple[Event, ...]:
+        return self._snapshot(event_type, self._by_type[event_type])
     
-    def get_by_sender(self, sender_id: str) -> list[Event]:
-        return [e for e in self.events if e.sender_id == sender_id]
+    def get_by_sender(self, sender_id: str) -> tuple[Event, ...]:
+        return self._snapshot(sender_id, self._by_sender.get(sender_id, ()))
     
-    def get_human_events(self) -> list[Event]:
+    def get_human_events(self) -> tuple[Event, ...]:
         return self.get_by_sender(HUMAN_ID)
     
-    def get_agent_events(self) -> list[Event]:
+    def get_agent_events(self) -> tuple[Event, ...]:
         return self.get_by_sender(AGENT_ID)
     
     def get_last(self, count: int = 1) -> list[Event]:
-        return self.events[-count:] if self.events else []
+        # events[-0:] would be the whole history
+        return self.events[-count:] if count > 0 else []
     
     def get_last_offer(self) -> Optional[Event]:
         """Get the most recent SEND_OFFER event."""
-        offers = self.get_by_type(EventType.SEND_OFFER)
+        offers = self._by_type[EventType.SEND_OFFER]
         return offers[-1] if offers else None
     
     def get_last_human_offer(self) -> Optional[Event]:
         """Get the most recent offer from human."""
-        offers = [
-            e for e in self.events 
-            if e.event_type == EventType.SEND_OFFER and e.sender_id == HUMAN_ID
-        ]
-        return offers[-1] if offers else None
+        return self._last_offer_by_sender.get(HUMAN_ID)
     
     def get_last_agent_offer(self) -> Optional[Event]:
         """Get the most recent offer from agent."""
-        offers = [
-            e for e in self.events 
-            if e.event_type == EventType.SEND_OFFER and e.sender_id == AGENT_ID
-        ]
-        return offers[-1] if offers else None
+        return self._last_offer_by_sender.get(AGENT_ID)
     
-    def get_messages(self) -> list[Event]:
+    def get_messages(self) -> tuple[Event, ...]:
         return self.get_by_type(EventType.SEND_MESSAGE)
     
+    def get_message_count(self) -> int:
+        return len(self._by_type[EventType.SEND_MESSAGE])
+    
     def get_offer_count(self) -> int:
-        return len(self.get_by_type(EventType.SEND_OFFER))
+        return len(self._by_type[EventType.SEND_OFFER])
+    
+    def get_offer_count_by(self, sender_id: str) -> int:
+        """Get number of offers made by a sender."""
+        return self._offer_counts.get(sender_id, 0)
     
     def get_time_since_last_event(self, exclude_time_events: bool = True) -> Optional[float]:
         """Get seconds since last event (optionally excluding TIME events)."""
         if not self.events:
             return None
         
-        events = self.events
-        if exclude_time_events:
-            events = [e for e in events if e.event_type != EventType.TIME]
-        
-        if not events:
+        last = self._last_non_time if exclude_time_events else self.events[-1]
+        if last is None:
             return None
         
-        return time.time() - events[-1].timestamp
+        return time.time() - last.timestamp
     
     def clear(self) -> None:
         self.events.clear()
+        for events in self._by_type:
+            events.clear()
+        self._by_sender.clear()
+        self._last_offer_by_sender.clear()
+        self._offer_counts.clear()
+        self._last_non_time = None
+        self._snapshots.clear()
 
 
 class NegotiationSession:
@@ -137,6 +178,10 @@ class NegotiationSession:
         self._current_offer: Offer = game.create_initial_offer()
         self._acceptance = FormalAcceptance()
         
+        # The game is fixed for the session, so max utilities are computed once
+        self._human_max_utility = game.human_utility.get_max_possible(game.issues)
+        self._agent_max_utility = game.agent_utility.get_max_possible(game.issues)
+        
         # History
         self._history = NegotiationHistory()
         
@@ -174,7 +219,7 @@ class NegotiationSession:
             raise RuntimeError(f"Cannot start session in state {self._state}")
         
         self._state = SessionState.IN_PROGRESS
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         
         event = Event.game_start(self.game.name)
         self._history.add(event)
@@ -204,10 +249,8 @@ class NegotiationSession:
     
     def _handle_offer(self, event: Event) -> None:
         """Handle SEND_OFFER event."""
-        offer_dict = event.get_offer()
-        if offer_dict:
-            offer = Offer.from_dict(offer_dict)
-            
+        offer = event.get_offer_object()
+        if offer:
             # Validate offer
             is_valid, error = self.game.validate_offer(offer)
             if not is_valid:
@@ -258,22 +301,26 @@ class NegotiationSession:
         else:
             self._state = SessionState.COMPLETED
         
-        self._end_time = time.time()
+        self._end_time = time.monotonic()
     
     def get_elapsed_time(self) -> float:
         """Get elapsed time in seconds."""
         if self._start_time is None:
             return 0.0
-        end = self._end_time or time.time()
+        end = self._end_time or time.monotonic()
         return end - self._start_time
     
     def get_remaining_time(self) -> Optional[float]:
         """Get remaining time in seconds, or None if no deadline."""
-        if not self.game.rules.has_deadline():
-            return None
-        deadline = self.game.rules.deadline_seconds
+        return self.get_timing()[1]
+    
+    def get_timing(self) -> tuple[float, Optional[float]]:
+        """Get (elapsed, remaining) seconds from a single clock read."""
         elapsed = self.get_elapsed_time()
-        return max(0, deadline - elapsed)
+        rules = self.game.rules
+        if not rules.has_deadline():
+            return (elapsed, None)
+        return (elapsed, max(0, rules.deadline_seconds - elapsed))
     
     def is_timed_out(self) -> bool:
         """Check if deadline has passed."""
@@ -282,23 +329,34 @@ class NegotiationSession:
     
     def get_human_utility(self, offer: Optional[Offer] = None) -> float:
         """Calculate human's utility for an offer (default: current offer)."""
-        offer = offer or self._current_offer
+        offer = offer if offer is not None else self._current_offer
         return self.game.human_utility.calculate(offer)
     
     def get_agent_utility(self, offer: Optional[Offer] = None) -> float:
         """Calculate agent's utility for an offer (default: current offer)."""
-        offer = offer or self._current_offer
+        offer = offer if offer is not None else self._current_offer
         return self.game.agent_utility.calculate(offer)
     
     def get_utilities(self, offer: Optional[Offer] = None) -> tuple[float, float]:
         """Get (human_utility, agent_utility) for an offer."""
         return (self.get_human_utility(offer), self.get_agent_utility(offer))
     
+    def get_utilities_batch(self, offers: Sequence[Offer]) -> tuple[list[float], list[float]]:
+        """
+        Evaluate many candidate offers at once.
+        
+        Returns (human_utilities, agent_utilities) in the same order as offers.
+        """
+        return (
+            list(map(self.game.human_utility.calculate, offers)),
+            list(map(self.game.agent_utility.calculate, offers)),
+        )
+    
     def get_utility_percentages(self, offer: Optional[Offer] = None) -> tuple[float, float]:
         """Get utilities as percentages of max possible."""
-        offer = offer or self._current_offer
-        human_max = self.game.human_utility.get_max_possible(self.game.issues)
-        agent_max = self.game.agent_utility.get_max_possible(self.game.issues)
+        offer = offer if offer is not None else self._current_offer
+        human_max = self._human_max_utility
+        agent_max = self._agent_max_utility
         
         human_pct = (self.get_human_utility(offer) / human_max * 100) if human_max else 0
         agent_pct = (self.get_agent_utility(offer) / agent_max * 100) if agent_max else 0
@@ -324,16 +382,28 @@ class NegotiationSession:
         
         return True
     
+    def get_summary_compact(self) -> dict:
+        """Get a lightweight summary (no offer dict or utilities) for per-tick logging."""
+        elapsed, remaining = self.get_timing()
+        return {
+            "session_id": self.session_id,
+            "state": self._state.value,
+            "elapsed_seconds": elapsed,
+            "remaining_seconds": remaining,
+            "offer_count": self._history.get_offer_count(),
+        }
+    
     def get_summary(self) -> dict:
         """Get summary of session state for logging/display."""
+        elapsed, remaining = self.get_timing()
         return {
             "session_id": self.session_id,
             "game_name": self.game.name,
             "state": self._state.value,
-            "elapsed_seconds": self.get_elapsed_time(),
-            "remaining_seconds": self.get_remaining_time(),
+            "elapsed_seconds": elapsed,
+            "remaining_seconds": remaining,
             "offer_count": self._history.get_offer_count(),
-            "message_count": len(self._history.get_messages()),
+            "message_count": self._history.get_message_count(),
             "human_accepted": self._acceptance.human_accepted,
             "agent_accepted": self._acceptance.agent_accepted,
             "current_offer": self._current_offer.to_dict() if self._current_offer else None,
@@ -11,6 +11,24 @@ from typing import Union
 
 from ..models import Issue, UtilityFunction, ProtocolRules, GameSpec, Party
 
+# orjson is optional; the standard library json is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
 
 class MultiIssueBargainingGame:
     """
@@ -149,8 +167,7 @@ def load_game_from_json(path: Union[str, Path]) -> GameSpec:
     }
     """
     path = Path(path)
-    with open(path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = _loads(path.read_bytes())
     
     return MultiIssueBargainingGame.create(
         name=config["name"],
@@ -186,6 +203,5 @@ def save_game_to_json(game: GameSpec, path: Union[str, Path]) -> None:
         "allow_partial": game.rules.allow_partial_agreements,
     }
     
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    path.write_bytes(_dumps(config))
 
@@ -9,8 +9,10 @@ Matches IAGO's representation:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
+import sys
 
 
 class Party(Enum):
@@ -19,7 +21,7 @@ class Party(Enum):
     HUMAN = "human"
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """
     A single negotiable issue (e.g., 'apples', 'salary').
@@ -36,24 +38,28 @@ class Issue:
     divisible: bool = False
     
     def __post_init__(self):
+        # Interned so offer/utility dict lookups hit the identity fast path
+        self.name = sys.intern(self.name)
         if self.quantity < 1:
             raise ValueError(f"Issue quantity must be at least 1, got {self.quantity}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Allocation:
     """
     Allocation of a single issue across the 3-row board.
     
     IAGO uses [agent_count, middle_count, human_count] format.
     Middle items are undecided/unallocated.
+    
+    Immutable, so offers can share instances; of() returns cached ones.
     """
     agent: int
     middle: int
     human: int
     
     def __post_init__(self):
-        if any(x < 0 for x in [self.agent, self.middle, self.human]):
+        if self.agent < 0 or self.middle < 0 or self.human < 0:
             raise ValueError("Allocation values cannot be negative")
     
     @property
@@ -67,31 +73,36 @@ class Allocation:
     def to_tuple(self) -> tuple[int, int, int]:
         return (self.agent, self.middle, self.human)
     
+    @classmethod
+    @lru_cache(maxsize=256)
+    def of(cls, agent: int, middle: int, human: int) -> "Allocation":
+        """Get a shared instance for these counts."""
+        return cls(agent=agent, middle=middle, human=human)
+    
     @classmethod
     def from_tuple(cls, t: tuple[int, int, int]) -> "Allocation":
-        return cls(agent=t[0], middle=t[1], human=t[2])
+        return cls.of(t[0], t[1], t[2])
     
     @classmethod
     def all_to_agent(cls, quantity: int) -> "Allocation":
-        return cls(agent=quantity, middle=0, human=0)
+        return cls.of(quantity, 0, 0)
     
     @classmethod
     def all_to_human(cls, quantity: int) -> "Allocation":
-        return cls(agent=0, middle=0, human=quantity)
+        return cls.of(0, 0, quantity)
     
     @classmethod
     def all_in_middle(cls, quantity: int) -> "Allocation":
-        return cls(agent=0, middle=quantity, human=0)
+        return cls.of(0, quantity, 0)
     
     @classmethod
     def split_even(cls, quantity: int) -> "Allocation":
         """Split evenly, remainder goes to middle."""
-        each = quantity // 2
-        remainder = quantity - (each * 2)
-        return cls(agent=each, middle=remainder, human=each)
+        each = quantity >> 1
+        return cls.of(each, quantity & 1, each)
 
 
-@dataclass
+@dataclass(slots=True)
 class Offer:
     """
     A negotiation offer representing allocation of all issues.
@@ -105,7 +116,11 @@ class Offer:
         return self.allocations.get(issue_name)
     
     def __setitem__(self, issue_name: str, allocation: Optional[Allocation]):
-        self.allocations[issue_name] = allocation
+        self.allocations[sys.intern(issue_name)] = allocation
+    
+    def items(self):
+        """(issue_name, allocation) pairs in the offer's own order."""
+        return self.allocations.items()
     
     def is_complete(self) -> bool:
         """
@@ -138,12 +153,16 @@ class Offer:
         ]
     
     def copy(self) -> "Offer":
-        """Create a deep copy of this offer."""
-        new_allocations = {
-            name: Allocation(alloc.agent, alloc.middle, alloc.human) if alloc else None
-            for name, alloc in self.allocations.items()
-        }
-        return Offer(allocations=new_allocations)
+        """Create a copy of this offer (Allocations are immutable, so they are shared)."""
+        return Offer(allocations=dict(self.allocations))
+    
+    def with_allocation(self, issue_name: str, allocation: Optional[Allocation]) -> "Offer":
+        """New offer with one issue changed; other allocations are shared."""
+        return Offer(allocations=self.allocations | {issue_name: allocation})
+    
+    def with_allocations(self, changes: dict[str, Optional[Allocation]]) -> "Offer":
+        """New offer with several issues changed; other allocations are shared."""
+        return Offer(allocations=self.allocations | changes)
     
     @classmethod
     def empty(cls, issue_names: list[str]) -> "Offer":
@@ -169,32 +188,44 @@ class Offer:
     def from_dict(cls, data: dict) -> "Offer":
         """Deserialize from dictionary."""
         return cls(allocations={
-            name: Allocation.from_tuple(tuple(val)) if val else None
+            sys.intern(name): Allocation.from_tuple(tuple(val)) if val else None
             for name, val in data.items()
         })
 
 
-@dataclass
+@dataclass(slots=True)
 class UtilityFunction:
     """
     Calculates utility (score) for a party based on item values.
     
     Each party has different valuations for each issue.
+    Values are treated as fixed once constructed: the issue rankings
+    below are computed on first use and cached.
     """
     party: Party
     values: dict[str, float]  # issue_name -> value per unit
     
+    _issue_priority: Optional[tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _best_issue: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _worst_issue: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Keyed by interned issue names, like Offer.allocations
+        self.values = {sys.intern(k): v for k, v in self.values.items()}
+    
     def calculate(self, offer: Offer) -> float:
         """Calculate total utility for this party from an offer."""
+        # Party check and value lookup hoisted out of the per-issue loop
+        value_of = self.values.get
         total = 0.0
-        for issue_name, allocation in offer.allocations.items():
-            if allocation is None:
-                continue
-            value_per_unit = self.values.get(issue_name, 0.0)
-            if self.party == Party.AGENT:
-                total += allocation.agent * value_per_unit
-            else:
-                total += allocation.human * value_per_unit
+        if self.party == Party.AGENT:
+            for issue_name, allocation in offer.allocations.items():
+                if allocation is not None:
+                    total += allocation.agent * value_of(issue_name, 0.0)
+        else:
+            for issue_name, allocation in offer.allocations.items():
+                if allocation is not None:
+                    total += allocation.human * value_of(issue_name, 0.0)
         return total
     
     def get_max_possible(self, issues: list[Issue]) -> float:
@@ -206,18 +237,24 @@ class UtilityFunction:
     
     def get_issue_priority(self) -> list[str]:
         """Return issues sorted by value (highest first)."""
-        return sorted(self.values.keys(), key=lambda k: self.values[k], reverse=True)
+        if self._issue_priority is None:
+            self._issue_priority = tuple(sorted(self.values, key=self.values.__getitem__, reverse=True))
+        return list(self._issue_priority)
     
     def get_best_issue(self) -> str:
         """Return the highest-valued issue."""
-        return max(self.values.keys(), key=lambda k: self.values[k])
+        if self._best_issue is None:
+            self._best_issue = max(self.values, key=self.values.__getitem__)
+        return self._best_issue
     
     def get_worst_issue(self) -> str:
         """Return the lowest-valued issue."""
-        return min(self.values.keys(), key=lambda k: self.values[k])
+        if self._worst_issue is None:
+            self._worst_issue = min(self.values, key=self.values.__getitem__)
+        return self._worst_issue
 
 
-@dataclass
+@dataclass(slots=True)
 class ProtocolRules:
     """
     Rules governing the negotiation protocol.
@@ -231,7 +268,7 @@ class ProtocolRules:
         return self.deadline_seconds is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class GameSpec:
     """
     Complete specification of a negotiation game.
@@ -249,11 +286,18 @@ class GameSpec:
     issue_singular_names: dict[str, str] = field(default_factory=dict)
     issue_plural_names: dict[str, str] = field(default_factory=dict)
     
+    # Issue lookups, built once in __post_init__
+    _issues_by_name: dict[str, Issue] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _issue_names: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    
     def __post_init__(self):
+        self._issues_by_name = {issue.name: issue for issue in self.issues}
+        self._issue_names = tuple(self._issues_by_name)
+        
         # Validate that all issues have utility values
-        issue_names = {issue.name for issue in self.issues}
-        agent_issues = set(self.agent_utility.values.keys())
-        human_issues = set(self.human_utility.values.keys())
+        issue_names = self._issues_by_name.keys()
+        agent_issues = self.agent_utility.values.keys()
+        human_issues = self.human_utility.values.keys()
         
         if issue_names != agent_issues:
             missing = issue_names - agent_issues
@@ -265,6 +309,10 @@ class GameSpec:
             extra = human_issues - issue_names
             raise ValueError(f"Human utility mismatch. Missing: {missing}, Extra: {extra}")
         
+        # Re-key display names with the interned issue names
+        self.issue_singular_names = {sys.intern(k): v for k, v in self.issue_singular_names.items()}
+        self.issue_plural_names = {sys.intern(k): v for k, v in self.issue_plural_names.items()}
+        
         # Set default display names
         for issue in self.issues:
             if issue.name not in self.issue_singular_names:
@@ -274,14 +322,11 @@ class GameSpec:
     
     def get_issue(self, name: str) -> Optional[Issue]:
         """Get issue by name."""
-        for issue in self.issues:
-            if issue.name == name:
-                return issue
-        return None
+        return self._issues_by_name.get(name)
     
     def get_issue_names(self) -> list[str]:
         """Get list of all issue names."""
-        return [issue.name for issue in self.issues]
+        return list(self._issue_names)
     
     def get_num_issues(self) -> int:
         return len(self.issues)
@@ -299,8 +344,9 @@ class GameSpec:
         Validate that an offer is legal for this game.
         Returns (is_valid, error_message).
         """
+        allocation_of = offer.allocations.get
         for issue in self.issues:
-            alloc = offer[issue.name]
+            alloc = allocation_of(issue.name)
             if alloc is None:
                 continue  # Partial offers allowed
             if alloc.total != issue.quantity:
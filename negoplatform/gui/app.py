@@ -8,6 +8,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional
 from datetime import datetime
+from functools import partial
 
 from ..domain.models import GameSpec, Offer
 from ..core.events import Event, EventType, Expression, HUMAN_ID, AGENT_ID
@@ -51,6 +52,7 @@ class NegotiationApp:
         self._event_bus = EventBus()
         self._session = NegotiationSession(game)
         self._scheduler: Optional[Scheduler] = None
+        self._agent_context: Optional[AgentContext] = None
         
         # Create main window
         self._root = tk.Tk()
@@ -70,6 +72,13 @@ class NegotiationApp:
         
         # Timer for periodic updates
         self._timer_id: Optional[str] = None
+        self._timeout_id: Optional[str] = None
+        self._last_displayed_seconds: Optional[int] = None
+        
+        # Utility display refreshes are coalesced into one idle pass
+        # and skipped when the builder's offer has not changed
+        self._utility_update_pending = False
+        self._last_utility_version = -1
     
     def _setup_theme(self):
         """Setup dark theme styling."""
@@ -161,24 +170,47 @@ class NegotiationApp:
     
     def _setup_event_handlers(self):
         """Setup event bus subscriptions."""
-        # Subscribe to all events for logging/debugging
+        # Session state and agent routing see every event
         self._event_bus.subscribe(
             self._on_event,
             subscriber_id="app",
         )
+        
+        # UI refreshes only for the events that can change what they show.
+        # Subscribed after "app" so the session is already up to date.
+        self._event_bus.subscribe(
+            self._on_state_event,
+            subscriber_id="app-status",
+            event_types={
+                EventType.SEND_OFFER,
+                EventType.FORMAL_ACCEPT,
+                EventType.GAME_START,
+                EventType.GAME_END,
+            },
+        )
+        self._event_bus.subscribe(
+            self._on_offer_event,
+            subscriber_id="app-utility",
+            event_types={EventType.SEND_OFFER},
+        )
     
     def _on_event(self, event: Event):
-        """Handle all events (for logging)."""
+        """Handle all events: update the session and route human events to the agent."""
         # Update session state
         self._session.apply_event(event)
         
         # Route to agent if from human
         if event.sender_id == HUMAN_ID:
             self._route_to_agent(event)
-        
-        # Update UI based on event
+    
+    def _on_state_event(self, event: Event):
+        """Refresh status bar after an event that changes session state."""
         self._update_ui_from_event(event)
     
+    def _on_offer_event(self, event: Event):
+        """Refresh scores after an offer is sent."""
+        self._schedule_utility_update()
+    
     def _route_to_agent(self, event: Event):
         """Route an event to the agent and execute responses."""
         # Build agent context
@@ -191,31 +223,47 @@ class NegotiationApp:
         self._execute_actions(actions)
     
     def _build_agent_context(self) -> AgentContext:
-        """Build agent context from current session state."""
-        return AgentContext(
-            game=self.game,
-            agent_utility=self.game.agent_utility,
-            opponent_utility=self.game.human_utility,
-            current_offer=self._session.current_offer,
-            history=self._session.history,
-            elapsed_seconds=self._session.get_elapsed_time(),
-            remaining_seconds=self._session.get_remaining_time(),
-            human_has_accepted=self._session.acceptance.human_accepted,
-            agent_has_accepted=self._session.acceptance.agent_accepted,
-            session_id=self._session.session_id,
-        )
+        """Get the agent context, refreshed from current session state."""
+        session = self._session
+        elapsed, remaining = session.get_timing()
+        if self._agent_context is None:
+            self._agent_context = AgentContext(
+                game=self.game,
+                agent_utility=self.game.agent_utility,
+                opponent_utility=self.game.human_utility,
+                current_offer=session.current_offer,
+                history=session.history,
+                elapsed_seconds=elapsed,
+                remaining_seconds=remaining,
+                human_has_accepted=session.acceptance.human_accepted,
+                agent_has_accepted=session.acceptance.agent_accepted,
+                session_id=session.session_id,
+            )
+        else:
+            self._agent_context.update(
+                current_offer=session.current_offer,
+                elapsed_seconds=elapsed,
+                remaining_seconds=remaining,
+                human_has_accepted=session.acceptance.human_accepted,
+                agent_has_accepted=session.acceptance.agent_accepted,
+            )
+        return self._agent_context
     
     def _execute_actions(self, actions: list[Action]):
         """Execute a list of agent actions."""
+        execute = self._execute_single_action
         for action in actions:
             if isinstance(action, Schedule):
-                # Schedule for later
-                self._root.after(action.delay_ms, lambda a=action.action: self._execute_single_action(a))
-            elif hasattr(action, 'delay_ms') and action.delay_ms > 0:
+                if action.delay_ms > 0:
+                    # Schedule for later
+                    self._root.after(action.delay_ms, partial(execute, action.action))
+                else:
+                    execute(action.action)
+            elif getattr(action, 'delay_ms', 0) > 0:
                 # Action has its own delay
-                self._root.after(action.delay_ms, lambda a=action: self._execute_single_action(a))
+                self._root.after(action.delay_ms, partial(execute, action))
             else:
-                self._execute_single_action(action)
+                execute(action)
     
     def _execute_single_action(self, action: Action):
         """Execute a single agent action."""
@@ -232,10 +280,12 @@ class NegotiationApp:
             self._chat_panel.add_message("agent", action.text)
         
         elif isinstance(action, SendOffer):
-            # Create and publish offer event
+            # Create and publish offer event; the session keeps its own copy
+            # so later edits to the agent's Offer can't rewrite history
             event = Event.send_offer(
                 sender_id=AGENT_ID,
                 offer_dict=action.offer.to_dict(),
+                offer=action.offer.copy(),
             )
             self._event_bus.publish(event)
             
@@ -244,7 +294,7 @@ class NegotiationApp:
             self._chat_panel.add_message("system", "Agent sent a new offer.")
             
             # Update utility preview
-            self._update_utility_display()
+            self._schedule_utility_update()
         
         elif isinstance(action, SendExpression):
             # Create and publish expression event
@@ -272,10 +322,7 @@ class NegotiationApp:
     def _update_ui_from_event(self, event: Event):
         """Update UI based on an event."""
         # Update status bar
-        self._status_bar.update_time(
-            self._session.get_elapsed_time(),
-            self._session.get_remaining_time(),
-        )
+        self._status_bar.update_time(*self._session.get_timing())
         
         # Update acceptance status
         self._status_bar.set_acceptance_status(
@@ -283,12 +330,25 @@ class NegotiationApp:
             agent_accepted=self._session.acceptance.agent_accepted,
             can_accept=self._session.can_formally_accept(),
         )
-        
-        # Update scores
+    
+    def _schedule_utility_update(self):
+        """Request a utility display refresh on the next Tk idle cycle."""
+        if not self._utility_update_pending:
+            self._utility_update_pending = True
+            self._root.after_idle(self._flush_utility_update)
+    
+    def _flush_utility_update(self):
+        """Run the pending utility display refresh."""
+        self._utility_update_pending = False
         self._update_utility_display()
     
     def _update_utility_display(self):
         """Update utility displays."""
+        version = self._offer_panel.offer_version
+        if version == self._last_utility_version:
+            return
+        self._last_utility_version = version
+        
         offer = self._offer_panel.get_offer()
         human_util = self.game.human_utility.calculate(offer)
         agent_util = self.game.agent_utility.calculate(offer)
@@ -312,7 +372,7 @@ class NegotiationApp:
             messagebox.showerror("Invalid Offer", error)
             return
         
-        event = Event.send_offer(sender_id=HUMAN_ID, offer_dict=offer.to_dict())
+        event = Event.send_offer(sender_id=HUMAN_ID, offer_dict=offer.to_dict(), offer=offer)
         self._chat_panel.add_message("system", "You sent an offer.")
         self._event_bus.publish(event)
     
@@ -323,7 +383,7 @@ class NegotiationApp:
         self._event_bus.publish(event)
         
         # Update utility preview
-        self._update_utility_display()
+        self._schedule_utility_update()
     
     def _on_send_expression(self, expression: Expression):
         """Handle user sending an expression."""
@@ -380,22 +440,49 @@ class NegotiationApp:
             )
     
     def _start_timer_updates(self):
-        """Start periodic timer updates."""
+        """Start the clock display and arm the deadline timeout."""
+        # Drop timers from any earlier start so only one set is armed
+        if self._timer_id:
+            self._root.after_cancel(self._timer_id)
+            self._timer_id = None
+        if self._timeout_id:
+            self._root.after_cancel(self._timeout_id)
+            self._timeout_id = None
+        self._last_displayed_seconds = None
+        
+        _, remaining = self._session.get_timing()
+        if remaining is not None:
+            self._timeout_id = self._root.after(int(remaining * 1000), self._on_deadline)
+        
         def update():
-            if self._session.is_active:
-                self._status_bar.update_time(
-                    self._session.get_elapsed_time(),
-                    self._session.get_remaining_time(),
-                )
-                
-                # Check for timeout
-                if self._session.is_timed_out():
-                    self._handle_timeout()
-                else:
-                    self._timer_id = self._root.after(1000, update)
+            if not self._session.is_active:
+                return
+            elapsed, remaining = self._session.get_timing()
+            shown = elapsed if remaining is None else remaining
+            
+            # Only redraw when the displayed second changes
+            seconds = int(shown)
+            if seconds != self._last_displayed_seconds:
+                self._last_displayed_seconds = seconds
+                self._status_bar.update_time(elapsed, remaining)
+            
+            # Out of time: _on_deadline takes it from here
+            if remaining is not None and remaining <= 0:
+                self._timer_id = None
+                return
+            
+            # Wake up again at the next whole-second boundary
+            frac = shown % 1 if remaining is not None else 1 - shown % 1
+            self._timer_id = self._root.after(int((frac or 1.0) * 1000) + 1, update)
         
         update()
     
+    def _on_deadline(self):
+        """Fire the timeout once the deadline timer expires."""
+        self._timeout_id = None
+        if self._session.is_active:
+            self._handle_timeout()
+    
     def _handle_timeout(self):
         """Handle negotiation timeout."""
         event = Event.game_end("timeout")
@@ -419,6 +506,7 @@ class NegotiationApp:
         
         # Update status
         self._status_bar.set_game_status("In progress")
+        self._schedule_utility_update()
         self._chat_panel.add_message("system", "Negotiation started!")
         
         # Start timer updates
@@ -434,6 +522,8 @@ class NegotiationApp:
         """Stop the application."""
         if self._timer_id:
             self._root.after_cancel(self._timer_id)
+        if self._timeout_id:
+            self._root.after_cancel(self._timeout_id)
         self._root.quit()
 
 
@@ -47,6 +47,9 @@ class OfferBuilderPanel(ttk.Frame):
         self._issues: list[Issue] = []
         self._allocations: dict[str, IssueAllocation] = {}
         
+        # Bumped on every change to the displayed allocation
+        self._offer_version = 0
+        
         self._create_widgets()
         self._setup_layout()
     
@@ -185,6 +188,7 @@ class OfferBuilderPanel(ttk.Frame):
         """Set the issues to display in the builder."""
         self._issues = issues
         self._allocations.clear()
+        self._offer_version += 1
         
         # Clear existing issue widgets
         for widget in self._issues_frame.winfo_children():
@@ -315,6 +319,7 @@ class OfferBuilderPanel(ttk.Frame):
     
     def _notify_change(self):
         """Notify that offer has changed."""
+        self._offer_version += 1
         if self._on_offer_changed:
             self._on_offer_changed(self.get_offer())
     
@@ -339,6 +344,12 @@ class OfferBuilderPanel(ttk.Frame):
                 alloc.agent_var.set(allocation.agent)
                 alloc.middle_var.set(allocation.middle)
                 alloc.human_var.set(allocation.human)
+        self._offer_version += 1
+    
+    @property
+    def offer_version(self) -> int:
+        """Counter that changes whenever the displayed offer changes."""
+        return self._offer_version
     
     def _send_offer(self):
         """Send the current offer."""
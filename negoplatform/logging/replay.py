@@ -5,6 +5,7 @@ Replays negotiation sessions from JSONL log files.
 """
 
 import json
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Generator, Optional, Callable
@@ -143,9 +144,8 @@ class ReplayEngine:
         offers = []
         
         for event in self.get_events():
-            offer_dict = event.get_offer()
-            if offer_dict:
-                offer = Offer.from_dict(offer_dict)
+            offer = event.get_offer_object()
+            if offer:
                 offers.append((event.sender_id, offer))
         
         return offers
@@ -167,18 +167,16 @@ class ReplayEngine:
         
         events = list(self.get_events())
         
-        human_offers = sum(1 for e in events if e.event_type == EventType.SEND_OFFER and e.sender_id == HUMAN_ID)
-        agent_offers = sum(1 for e in events if e.event_type == EventType.SEND_OFFER and e.sender_id == AGENT_ID)
-        human_messages = sum(1 for e in events if e.event_type == EventType.SEND_MESSAGE and e.sender_id == HUMAN_ID)
-        agent_messages = sum(1 for e in events if e.event_type == EventType.SEND_MESSAGE and e.sender_id == AGENT_ID)
+        # Single pass: tally by (type, sender)
+        counts = Counter((e.event_type, e.sender_id) for e in events)
         
         return {
             "session_id": self.session_id,
             "total_events": len(events),
-            "human_offers": human_offers,
-            "agent_offers": agent_offers,
-            "human_messages": human_messages,
-            "agent_messages": agent_messages,
+            "human_offers": counts[EventType.SEND_OFFER, HUMAN_ID],
+            "agent_offers": counts[EventType.SEND_OFFER, AGENT_ID],
+            "human_messages": counts[EventType.SEND_MESSAGE, HUMAN_ID],
+            "agent_messages": counts[EventType.SEND_MESSAGE, AGENT_ID],
             "result": self._result,
         }
 
@@ -98,13 +98,9 @@ class ExamplePluginAgent(NegotiationAgent):
         ]
     
     def on_send_expression(self, ctx: AgentContext, event: Event) -> list[Action]:
-        expr_str = event.get_expression()
-        if expr_str:
-            try:
-                expr = Expression(expr_str)
-                return [SendExpression(expr, duration_ms=1500)]
-            except ValueError:
-                pass
+        expr = Expression.parse(event.get_expression())
+        if expr is not None:
+            return [SendExpression(expr, duration_ms=1500)]
         return []
     
     def on_formal_accept(self, ctx: AgentContext, event: Event) -> list[Action]:
@@ -0,0 +1,162 @@
+"""Tests for EventBus dispatch and delayed delivery."""
+
+import threading
+import time
+
+from negoplatform.core.bus import EventBus
+from negoplatform.core.events import Event, EventType, HUMAN_ID
+
+
+def message(text: str, delay_ms: int = 0) -> Event:
+    return Event.send_message(HUMAN_ID, text, delay_ms=delay_ms)
+
+
+def test_delayed_events_are_dispatched_in_due_order():
+    bus = EventBus()
+    got = []
+    bus.subscribe(lambda e: got.append(e.get_text()), "rec")
+    bus.publish(message("late", 30))
+    bus.publish(message("early", 5))
+    bus.publish(message("middle", 15))
+
+    assert bus.process_delayed_events() == []
+    time.sleep(0.06)
+
+    assert [e.get_text() for e in bus.process_delayed_events()] == ["early", "middle", "late"]
+    assert got == ["early", "middle", "late"]
+    assert not bus.has_pending_delayed()
+
+
+def test_equal_due_times_keep_publish_order():
+    bus = EventBus()
+    bus.publish_all([message(str(i), 10) for i in range(20)] + [message("now")])
+
+    time.sleep(0.03)
+
+    assert [e.get_text() for e in bus.process_delayed_events()] == [str(i) for i in range(20)]
+
+
+def test_next_delay_and_clear():
+    bus = EventBus()
+    assert bus.get_next_delay() is None
+
+    bus.publish(message("a", 5000))
+    bus.publish(message("b", 100))
+
+    assert 0 < bus.get_next_delay() <= 0.1
+    assert bus.clear_delayed() == 2
+    assert bus.get_next_delay() is None
+    assert not bus.has_pending_delayed()
+
+
+def test_delay_processor_wakes_for_newly_queued_events():
+    bus = EventBus()
+    ready = []
+    delivered = threading.Event()
+
+    def on_ready(event):
+        ready.append(event.get_text())
+        if len(ready) == 2:
+            delivered.set()
+
+    bus.start_delay_processor(on_ready)
+    try:
+        # The loop is idle with nothing queued, so it must be woken by publish
+        time.sleep(0.05)
+        bus.publish(message("second", 40))
+        bus.publish(message("first", 10))
+
+        assert delivered.wait(1.0)
+        assert ready == ["first", "second"]
+    finally:
+        bus.stop_delay_processor()
+
+
+def test_stop_delay_processor_interrupts_the_wait():
+    bus = EventBus()
+    bus.start_delay_processor(lambda e: None)
+    bus.publish(message("never", 60_000))
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    bus.stop_delay_processor()
+
+    assert time.monotonic() - started < 0.5
+    assert bus.has_pending_delayed()
+
+
+def test_subscribers_only_receive_their_event_types_in_order():
+    bus = EventBus()
+    got = []
+    bus.subscribe(lambda e: got.append(("all", e.event_type)), "all")
+    bus.subscribe(lambda e: got.append(("offers", e.event_type)), "offers", {EventType.SEND_OFFER})
+    bus.subscribe(lambda e: got.append(("mixed", e.event_type)), "mixed", {EventType.SEND_OFFER, EventType.TIME})
+
+    bus.publish(Event.send_offer(HUMAN_ID, {}))
+    bus.publish(Event.time_tick(1.0))
+    bus.publish(message("hi"))
+
+    assert got == [
+        ("all", EventType.SEND_OFFER), ("offers", EventType.SEND_OFFER), ("mixed", EventType.SEND_OFFER),
+        ("all", EventType.TIME), ("mixed", EventType.TIME),
+        ("all", EventType.SEND_MESSAGE),
+    ]
+
+
+def test_resubscribe_replaces_and_unsubscribe_removes():
+    bus = EventBus()
+    got = []
+    bus.subscribe(lambda e: got.append("old"), "sub", {EventType.SEND_OFFER})
+    bus.subscribe(lambda e: got.append("new"), "sub", {EventType.SEND_MESSAGE})
+
+    bus.publish(Event.send_offer(HUMAN_ID, {}))
+    bus.publish(message("hi"))
+    bus.unsubscribe("sub")
+    bus.publish(message("again"))
+
+    assert got == ["new"]
+
+
+def test_subscription_changes_during_dispatch_apply_to_the_next_publish():
+    bus = EventBus()
+    got = []
+
+    def first(event):
+        got.append("first")
+        bus.unsubscribe("second")
+        bus.subscribe(lambda e: got.append("third"), "third")
+
+    bus.subscribe(first, "first")
+    bus.subscribe(lambda e: got.append("second"), "second")
+
+    bus.publish(message("one"))
+    assert got == ["first", "second"]
+
+    got.clear()
+    bus.publish(message("two"))
+    assert got == ["first", "third"]
+
+
+def test_concurrent_subscribe_does_not_break_dispatch():
+    bus = EventBus(safe_dispatch=False)
+    count = [0]
+    bus.subscribe(lambda e: count.__setitem__(0, count[0] + 1), "counter")
+    stop = threading.Event()
+
+    def churn():
+        i = 0
+        while not stop.is_set():
+            bus.subscribe(lambda e: None, f"tmp{i % 5}")
+            bus.unsubscribe(f"tmp{(i + 2) % 5}")
+            i += 1
+
+    thread = threading.Thread(target=churn)
+    thread.start()
+    try:
+        for _ in range(2000):
+            bus.publish(message("x"))
+    finally:
+        stop.set()
+        thread.join()
+
+    assert count[0] == 2000
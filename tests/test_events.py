@@ -0,0 +1,79 @@
+"""Tests for Event construction, copying and serialization."""
+
+import copy
+import json
+import pickle
+
+from negoplatform.agent_api.actions import SendMessage
+from negoplatform.agent_api.base import NegotiationAgent
+from negoplatform.core.events import Event, EventType, MessageSubtype, Preference, AGENT_ID, HUMAN_ID
+
+
+def test_empty_payload_events_pickle_and_deepcopy():
+    for event in (Event.formal_accept(AGENT_ID), Event.offer_in_progress(HUMAN_ID)):
+        assert pickle.loads(pickle.dumps(event)).payload == {}
+        assert copy.deepcopy(event).payload == {}
+
+
+def test_deserialized_empty_payload_is_a_fresh_dict():
+    data = Event.formal_accept(AGENT_ID).to_dict()
+
+    first = Event.from_dict(data)
+    second = Event.from_dict(Event.formal_accept(AGENT_ID).to_dict())
+    first.payload["note"] = "replayed"
+
+    assert second.payload == {}
+    assert Event.formal_accept(AGENT_ID).payload == {}
+
+
+def test_round_trip_preserves_subtype_and_payload():
+    events = [
+        Event.send_message(HUMAN_ID, "hi", MessageSubtype.GREETING, Preference("a", "b", "GREATER")),
+        Event.send_message(AGENT_ID, "plain"),
+        Event.send_offer(AGENT_ID, {"apples": (1, 2, 1)}),
+        Event.time_tick(1.0, 2.0),
+    ]
+    for event in events:
+        data = json.loads(json.dumps(event.to_dict()))
+        restored = Event.from_dict(data)
+
+        assert restored.to_dict() == data
+        assert restored.subtype is event.subtype
+
+
+def test_wire_names_round_trip_for_every_event_type():
+    for event_type in EventType:
+        assert event_type.wire_name == event_type.name.lower()
+        assert EventType.from_wire(event_type.wire_name) is event_type
+    # Upper-case names from older logs still resolve
+    assert EventType.from_wire("SEND_OFFER") is EventType.SEND_OFFER
+
+
+def test_serialized_event_type_is_the_wire_name():
+    data = Event.send_offer(HUMAN_ID, {"apples": (1, 0, 3)}).to_dict()
+
+    assert data["event_type"] == "send_offer"
+    assert Event.from_dict(data).event_type is EventType.SEND_OFFER
+
+
+def test_agent_routes_each_event_type_to_its_handler():
+    handler_names = {
+        EventType.SEND_MESSAGE: "on_send_message",
+        EventType.SEND_OFFER: "on_send_offer",
+        EventType.SEND_EXPRESSION: "on_send_expression",
+        EventType.OFFER_IN_PROGRESS: "on_offer_in_progress",
+        EventType.TIME: "on_time",
+        EventType.FORMAL_ACCEPT: "on_formal_accept",
+        EventType.GAME_START: "on_game_start",
+        EventType.GAME_END: "on_game_end",
+    }
+
+    def recorder(name):
+        return lambda self, ctx, event: [SendMessage(name)]
+
+    Recorder = type("Recorder", (NegotiationAgent,), {name: recorder(name) for name in handler_names.values()})
+    agent = Recorder()
+
+    for event_type, name in handler_names.items():
+        event = Event(event_type=event_type, sender_id=HUMAN_ID)
+        assert agent.handle_event(None, event) == [SendMessage(name)]
@@ -0,0 +1,121 @@
+"""Tests for NegoChat counter-offer choice and reset."""
+
+import random
+
+from negoplatform.agents.negochat.negochat_core import NegoChatCore, StackStrategy
+from negoplatform.domain.models import Allocation, GameSpec, Issue, Offer, Party, UtilityFunction
+
+
+def make_game(agent_values: dict[str, float], human_values: dict[str, float], quantity: int = 2) -> GameSpec:
+    issues = [Issue(name, name.title(), quantity) for name in agent_values]
+    return GameSpec(
+        name="test",
+        description="test game",
+        issues=issues,
+        agent_utility=UtilityFunction(Party.AGENT, agent_values),
+        human_utility=UtilityFunction(Party.HUMAN, human_values),
+    )
+
+
+def make_core(game: GameSpec, strategy: StackStrategy = StackStrategy.BALANCED) -> NegoChatCore:
+    return NegoChatCore(game, game.agent_utility, game.human_utility, strategy=strategy)
+
+
+def make_offer(**allocations: tuple[int, int, int]) -> Offer:
+    return Offer(allocations={name: Allocation.from_tuple(t) for name, t in allocations.items()})
+
+
+def first_found_counter(core: NegoChatCore, offer: Offer, max_changes: int = 2) -> dict[str, Allocation]:
+    """The counter rule before chunk1-22: first eligible issues in stack order."""
+    changes = {}
+    for name in core.stacks.stack_a:
+        alloc = offer[name]
+        if len(changes) < max_changes and alloc and alloc.human > 0 and alloc.agent < alloc.total:
+            changes[name] = Allocation.of(alloc.agent + 1, alloc.middle, alloc.human - 1)
+    for name in core.stacks.stack_b:
+        alloc = offer[name]
+        if len(changes) < max_changes and alloc and alloc.agent > 0:
+            changes[name] = Allocation.of(alloc.agent - 1, alloc.middle, alloc.human + 1)
+    return changes
+
+
+def test_counter_takes_back_most_valuable_stack_a_issues():
+    # Stack A is ordered by value difference (x first), but x is worth least to the agent
+    game = make_game({"x": 2, "y": 5, "z": 6}, {"x": 0, "y": 4, "z": 5})
+    core = make_core(game)
+    assert core.stacks.stack_a == ["x", "y", "z"]
+
+    action, counter, _ = core.handle_offer(make_offer(x=(0, 0, 2), y=(0, 0, 2), z=(0, 0, 2)), None)
+
+    assert action == "counter"
+    assert counter.to_dict() == {"x": (0, 0, 2), "y": (1, 0, 1), "z": (1, 0, 1)}
+
+
+def test_counter_gives_away_cheapest_stack_b_issue():
+    game = make_game({"a": 5, "b1": 3, "b2": 1}, {"a": 1, "b1": 5, "b2": 4})
+    core = make_core(game)
+    assert core.stacks.stack_b == ["b1", "b2"]
+
+    action, counter, _ = core.handle_offer(make_offer(a=(0, 0, 2), b1=(1, 0, 1), b2=(1, 0, 1)), None)
+
+    assert action == "counter"
+    assert counter.to_dict() == {"a": (1, 0, 1), "b1": (1, 0, 1), "b2": (0, 0, 2)}
+
+
+def test_counter_is_never_worse_than_first_found_counter():
+    rng = random.Random(7)
+    for _ in range(300):
+        names = [f"i{k}" for k in range(rng.randint(1, 6))]
+        game = make_game(
+            {name: rng.randint(0, 5) for name in names},
+            {name: rng.randint(0, 5) for name in names},
+            quantity=rng.randint(1, 5),
+        )
+        for strategy in StackStrategy:
+            core = make_core(game, strategy)
+            allocations = {}
+            for name in names:
+                agent = rng.randint(0, game.get_issue(name).quantity)
+                human = rng.randint(0, game.get_issue(name).quantity - agent)
+                allocations[name] = Allocation.of(agent, game.get_issue(name).quantity - agent - human, human)
+            offer = Offer(allocations=allocations)
+
+            counter = core._generate_counter(offer, {})
+            old_changes = first_found_counter(core, offer)
+            if counter is None:
+                assert not old_changes
+                continue
+
+            new_changes = {n for n in names if counter[n] != offer[n]}
+            assert len(new_changes) == len(old_changes)
+            old_counter = offer.with_allocations(old_changes)
+            assert game.agent_utility.calculate(counter) >= game.agent_utility.calculate(old_counter)
+
+
+def test_reset_restores_initial_stacks():
+    game = make_game({"x": 2, "y": 5, "b": 1}, {"x": 0, "y": 4, "b": 3})
+    core = make_core(game)
+    initial = (list(core.stacks.stack_a), list(core.stacks.stack_b), list(core.stacks.neutral))
+
+    core.stacks.stack_a.pop()
+    core.stacks.stack_b.clear()
+    core.reset()
+
+    assert (core.stacks.stack_a, core.stacks.stack_b, core.stacks.neutral) == initial
+    assert core.get_stats()["offers_made"] == 0
+
+    # Mutating the restored stacks must not leak into the next reset
+    core.stacks.stack_a.clear()
+    core.reset()
+    assert core.stacks.stack_a == initial[0]
+
+
+def test_reset_rebuilds_stacks_after_strategy_change():
+    game = make_game({"x": 2, "y": 5, "z": 6}, {"x": 0, "y": 4, "z": 5})
+    core = make_core(game)
+
+    core.strategy = StackStrategy.AGGRESSIVE
+    core.reset()
+
+    expected = make_core(game, StackStrategy.AGGRESSIVE).stacks
+    assert core.stacks.stack_a == expected.stack_a == ["z", "y", "x"]
@@ -0,0 +1,99 @@
+"""Tests for Scheduler action ordering, cancellation and wakeups."""
+
+import threading
+import time
+
+from negoplatform.core.bus import EventBus
+from negoplatform.core.scheduler import Scheduler
+
+
+def make_scheduler(**kwargs) -> Scheduler:
+    return Scheduler(EventBus(), time_tick_interval_ms=10_000, **kwargs)
+
+
+def run_due(scheduler: Scheduler) -> None:
+    # Drive the loop body directly so ordering doesn't depend on thread timing
+    scheduler._process_actions(time.monotonic() + 60)
+
+
+def test_actions_run_in_due_order():
+    scheduler = make_scheduler()
+    ran = []
+    scheduler.schedule_action(30, lambda: ran.append("c"), "c")
+    scheduler.schedule_action(10, lambda: ran.append("a"), "a")
+    scheduler.schedule_action(20, lambda: ran.append("b"), "b")
+    scheduler.schedule_action(10, lambda: ran.append("a2"), "a2")
+
+    run_due(scheduler)
+
+    assert ran == ["a", "a2", "b", "c"]
+
+
+def test_cancelled_actions_are_skipped():
+    scheduler = make_scheduler()
+    ran = []
+    scheduler.schedule_action(10, lambda: ran.append("keep"), "keep")
+    scheduler.schedule_action(20, lambda: ran.append("drop"), "drop")
+    scheduler.schedule_action(30, lambda: ran.append("drop again"), "drop")
+
+    assert scheduler.cancel_action("drop") is True
+    assert scheduler.cancel_action("drop") is False
+    assert scheduler.cancel_action("missing") is False
+    run_due(scheduler)
+
+    assert ran == ["keep"]
+
+
+def test_cancel_all_counts_only_live_actions():
+    scheduler = make_scheduler()
+    scheduler.schedule_action(10, lambda: None, "a")
+    scheduler.schedule_action(20, lambda: None, "b")
+    scheduler.schedule_action(30, lambda: None, "c")
+    scheduler.cancel_action("b")
+
+    assert scheduler.cancel_all_actions() == 2
+    assert scheduler.cancel_all_actions() == 0
+
+
+def test_ran_action_id_can_be_cancelled_only_while_pending():
+    scheduler = make_scheduler()
+    scheduler.schedule_action(10, lambda: None, "once")
+    run_due(scheduler)
+
+    assert scheduler.cancel_action("once") is False
+
+
+def test_new_sooner_action_wakes_a_sleeping_loop():
+    scheduler = make_scheduler()
+    ran = threading.Event()
+    scheduler.start()
+    try:
+        # Let the loop settle into its 10 s wait for the next tick
+        time.sleep(0.05)
+        scheduler.schedule_action(10, ran.set, "soon")
+
+        assert ran.wait(1.0)
+    finally:
+        scheduler.stop()
+
+
+def test_stop_interrupts_the_wait():
+    scheduler = make_scheduler()
+    scheduler.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    scheduler.stop()
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_deadline_fires_without_waiting_for_a_tick():
+    timed_out = threading.Event()
+    scheduler = make_scheduler(deadline_seconds=0)
+    scheduler.set_on_timeout(timed_out.set)
+    scheduler.start()
+    try:
+        assert timed_out.wait(1.0)
+    finally:
+        scheduler.stop()
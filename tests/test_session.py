@@ -0,0 +1,96 @@
+"""Tests for NegotiationHistory lookups."""
+
+from negoplatform.core.events import Event, EventType, HUMAN_ID, AGENT_ID
+from negoplatform.core.session import NegotiationHistory
+
+
+def make_history() -> NegotiationHistory:
+    history = NegotiationHistory()
+    history.add(Event.send_message(HUMAN_ID, "hi"))
+    history.add(Event.send_message(AGENT_ID, "hello"))
+    history.add(Event.send_message(HUMAN_ID, "deal?"))
+    return history
+
+
+def test_get_last_returns_most_recent_events():
+    history = make_history()
+
+    assert [e.get_text() for e in history.get_last(2)] == ["hello", "deal?"]
+    assert [e.get_text() for e in history.get_last()] == ["deal?"]
+
+
+def test_get_last_zero_or_negative_is_empty():
+    history = make_history()
+
+    assert history.get_last(0) == []
+    assert history.get_last(-1) == []
+
+
+def test_get_last_on_empty_history():
+    assert NegotiationHistory().get_last(3) == []
+
+
+def test_indexes_track_added_events():
+    history = NegotiationHistory()
+    history.add(Event.send_offer(HUMAN_ID, {"apples": (0, 0, 4)}))
+    history.add(Event.send_message(AGENT_ID, "no"))
+    history.add(Event.send_offer(AGENT_ID, {"apples": (2, 0, 2)}))
+    history.add(Event.send_offer(HUMAN_ID, {"apples": (1, 0, 3)}))
+    history.add(Event.time_tick(1.0))
+
+    assert [e.get_offer() for e in history.get_by_type(EventType.SEND_OFFER)] == [
+        {"apples": (0, 0, 4)}, {"apples": (2, 0, 2)}, {"apples": (1, 0, 3)},
+    ]
+    assert len(history.get_by_sender(HUMAN_ID)) == 2
+    assert history.get_last_offer().get_offer() == {"apples": (1, 0, 3)}
+    assert history.get_last_human_offer().get_offer() == {"apples": (1, 0, 3)}
+    assert history.get_last_agent_offer().get_offer() == {"apples": (2, 0, 2)}
+    assert history.get_offer_count() == 3
+    assert history.get_offer_count_by(HUMAN_ID) == 2
+    assert history.get_offer_count_by("nobody") == 0
+    assert history.get_message_count() == 1
+    # The TIME tick is not the last "real" event
+    assert history._last_non_time.get_offer() == {"apples": (1, 0, 3)}
+
+
+def test_indexes_built_from_initial_events_and_cleared():
+    events = [Event.send_offer(HUMAN_ID, {"apples": (0, 0, 4)}), Event.send_message(AGENT_ID, "no")]
+    history = NegotiationHistory(events=list(events))
+
+    assert history.get_offer_count_by(HUMAN_ID) == 1
+    assert history.get_agent_events() == (events[1],)
+
+    history.clear()
+
+    assert history.get_all() == ()
+    assert history.get_last_human_offer() is None
+    assert history.get_offer_count_by(HUMAN_ID) == 0
+    assert history.get_time_since_last_event() is None
+
+
+def test_snapshots_are_reused_until_the_next_add():
+    history = make_history()
+
+    everything = history.get_all()
+    human = history.get_by_sender(HUMAN_ID)
+    messages = history.get_by_type(EventType.SEND_MESSAGE)
+    assert history.get_all() is everything
+    assert history.get_by_sender(HUMAN_ID) is human
+
+    history.add(Event.send_message(HUMAN_ID, "last call"))
+
+    assert len(everything) == 3 and len(human) == 2 and len(messages) == 3
+    assert [e.get_text() for e in history.get_all()] == ["hi", "hello", "deal?", "last call"]
+    assert len(history.get_by_sender(HUMAN_ID)) == 3
+    assert len(history.get_messages()) == 4
+
+
+def test_snapshots_dropped_on_clear():
+    history = make_history()
+    history.get_all()
+    history.get_by_sender(AGENT_ID)
+
+    history.clear()
+
+    assert history.get_all() == ()
+    assert history.get_by_sender(AGENT_ID) == ()
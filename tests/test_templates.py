@@ -0,0 +1,41 @@
+"""Tests for NegoChat template selection."""
+
+import random
+
+from negoplatform.agents.negochat.templates import NegoChatTemplates
+from negoplatform.domain.games.multi_issue import MultiIssueBargainingGame
+
+
+def make_templates() -> NegoChatTemplates:
+    return NegoChatTemplates(MultiIssueBargainingGame.create_classic_resource_game())
+
+
+def test_picks_avoid_the_recent_window():
+    random.seed(11)
+    templates = make_templates()
+    for pool in (templates.GREETINGS, templates.ACCEPT_OFFER, templates.RESPOND_SAD, templates.WANT_ISSUE):
+        window = min(5, len(pool) // 2)
+        picks = [templates._pick(pool) for _ in range(300)]
+
+        for i, pick in enumerate(picks):
+            assert pick not in picks[max(0, i - window):i]
+        assert set(picks) == set(pool)
+
+
+def test_pools_keep_separate_windows():
+    random.seed(12)
+    templates = make_templates()
+    greeting = templates._pick(templates.GREETINGS)
+
+    # Drawing from another pool doesn't clear the greeting window
+    for _ in range(10):
+        templates._pick(templates.FAREWELL_FAIL)
+
+    assert templates._pick(templates.GREETINGS) != greeting
+
+
+def test_single_template_pool_always_returns_it():
+    templates = make_templates()
+    pool = ("only {item}",)
+
+    assert [templates._pick(pool) for _ in range(3)] == list(pool) * 3